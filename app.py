@@ -5,26 +5,32 @@ import logging
 from pathlib import Path
 import sys
 
-from PySide6 import QtWidgets
-
-from ui.main_window import MainWindow
-
 LOG_DIR = Path(__file__).resolve().parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8"),
-        logging.StreamHandler(),
-    ],
-)
+if not logging.getLogger().hasHandlers():
+    try:
+        LOG_DIR.mkdir()
+    except FileExistsError:
+        pass
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[
+            logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8", delay=True),
+            logging.StreamHandler(),
+        ],
+    )
 
 
 def main() -> None:
+    # Qt is imported lazily so tooling that imports this module stays light.
+    from PySide6 import QtWidgets
+
+    from ui.main_window import MainWindow
+
     app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
+    app.aboutToQuit.connect(win.store.flush)
     win.show()
     sys.exit(app.exec())
 
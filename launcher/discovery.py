@@ -4,117 +4,241 @@ from __future__ import annotations
 import json
 import logging
 import os
+import pickle
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from .models import Game, discovery_key
+from .models import Game
 
 _LOGGER = logging.getLogger(__name__)
 
 MAX_DEFAULT_ITEMS = 200
+# Manifest reads are I/O bound, so oversubscribe the CPU count.
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-URI_TEMPLATES = {
-    "steam": "steam://rungameid/{id}",
-    "epic": "com.epicgames.launcher://apps/{name}?action=launch",
-}
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+MANIFEST_CACHE_FILE = CACHE_DIR / "manifests.pickle"
+
+# Launch URIs are built by concatenation: steam://rungameid/<appid> and
+# com.epicgames.launcher://apps/<AppName>?action=launch
+STEAM_URI_PREFIX = "steam://rungameid/"
+EPIC_URI_PREFIX = "com.epicgames.launcher://apps/"
+EPIC_URI_SUFFIX = "?action=launch"
+
+
+# Whitespace is left unmatched so ``finditer`` skips it inside the regex engine.
+_VDF_RE = re.compile(
+    r'"([^"\\]*(?:\\.[^"\\]*)*)\\?"?|(\{)|(\})|//[^\r\n]*|([^\r\n\t {}"][^\r\n\t {}]*)',
+    re.S,
+)
+_VDF_ESCAPE_RE = re.compile(r"\\(.)", re.S)
+# Steam writes an app manifest's scalar AppState fields before its nested
+# sections, so the first quoted pair for each key is the top-level value.
+_ACF_PAIR_RE = re.compile(rb'"([^"\\]*(?:\\.[^"\\]*)*)"\s+"([^"\\]*(?:\\.[^"\\]*)*)"', re.S)
+_ACF_FIELDS = (b"appid", b"name", b"installdir")
+_LBRACE = ("LBRACE", None)
+_RBRACE = ("RBRACE", None)
 
 
 def _tokenize_vdf(text: str) -> List[tuple[str, Optional[str]]]:
     tokens: List[tuple[str, Optional[str]]] = []
-    i = 0
-    length = len(text)
-    while i < length:
-        ch = text[i]
-        if ch in "\r\n\t ":
-            i += 1
-            continue
-        if ch == "/" and i + 1 < length and text[i + 1] == "/":
-            # comment until end of line
-            i += 2
-            while i < length and text[i] not in "\r\n":
-                i += 1
-            continue
-        if ch == '"':
-            i += 1
-            buf = []
-            while i < length:
-                ch = text[i]
-                if ch == "\\":
-                    i += 1
-                    if i < length:
-                        buf.append(text[i])
-                        i += 1
-                    continue
-                if ch == '"':
-                    i += 1
-                    break
-                buf.append(ch)
-                i += 1
-            tokens.append(("STRING", "".join(buf)))
-            continue
-        if ch == "{":
-            tokens.append(("LBRACE", None))
-            i += 1
-            continue
-        if ch == "}":
-            tokens.append(("RBRACE", None))
-            i += 1
-            continue
-        # fallback: bare token
-        start = i
-        while i < length and text[i] not in "\r\n\t {}":
-            i += 1
-        tokens.append(("STRING", text[start:i]))
+    append = tokens.append
+    for match in _VDF_RE.finditer(text):
+        group = match.lastindex
+        if group == 1:
+            value = match.group(1)
+            if "\\" in value:
+                value = _VDF_ESCAPE_RE.sub(r"\1", value)
+            append(("STRING", value))
+        elif group == 2:
+            append(_LBRACE)
+        elif group == 3:
+            append(_RBRACE)
+        elif group == 4:
+            append(("STRING", match.group(4)))
+        # comments match without a group and produce no token
     return tokens
 
 
-def _parse_tokens(tokens: Iterable[tuple[str, Optional[str]]], start: int = 0) -> tuple[int, Dict[str, Any]]:
-    tokens_list = list(tokens)
-    length = len(tokens_list)
-    idx = start
-    result: Dict[str, Any] = {}
-    current_key: Optional[str] = None
+def _parse_tokens(tokens: List[tuple[str, Optional[str]]]) -> Dict[str, Any]:
+    root: Dict[str, Any] = {}
+    stack: List[Dict[str, Any]] = [root]
+    key_stack: List[Optional[str]] = [None]
 
-    while idx < length:
-        token_type, value = tokens_list[idx]
+    for token_type, value in tokens:
         if token_type == "STRING":
-            if current_key is None:
-                current_key = value or ""
+            key = key_stack[-1]
+            if key is None:
+                key_stack[-1] = value or ""
             else:
-                result[current_key] = value
-                current_key = None
-            idx += 1
-            continue
-        if token_type == "LBRACE":
-            idx, nested = _parse_tokens(tokens_list, idx + 1)
-            if current_key is not None:
-                result[current_key] = nested
-                current_key = None
-            continue
-        if token_type == "RBRACE":
-            return idx + 1, result
-        idx += 1
-    return idx, result
+                stack[-1][key] = value
+                key_stack[-1] = None
+        elif token_type == "LBRACE":
+            stack.append({})
+            key_stack.append(None)
+        elif token_type == "RBRACE":
+            if len(stack) == 1:
+                break  # unbalanced closing brace ends the document
+            child = stack.pop()
+            key_stack.pop()
+            key = key_stack[-1]
+            if key is not None:
+                stack[-1][key] = child
+                key_stack[-1] = None
+    else:
+        # unterminated sections are attached to their parents
+        while len(stack) > 1:
+            child = stack.pop()
+            key_stack.pop()
+            key = key_stack[-1]
+            if key is not None:
+                stack[-1][key] = child
+                key_stack[-1] = None
+    return root
 
 
 def parse_vdf(text: str) -> Dict[str, Any]:
     tokens = _tokenize_vdf(text)
     if not tokens:
         return {}
-    _, data = _parse_tokens(tokens)
+    return _parse_tokens(tokens)
+
+
+def _load_manifest_cache() -> Dict[str, tuple[int, int, Dict[str, Any]]]:
+    try:
+        with MANIFEST_CACHE_FILE.open("rb") as fh:
+            data = pickle.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:  # corrupt or incompatible cache, rebuild it
+        _LOGGER.warning("Ignoring manifest cache %s: %s", MANIFEST_CACHE_FILE, exc)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# Parsed manifests keyed by path -> (st_mtime_ns, st_size, data). Loaded on
+# first use so importing this module stays cheap.
+_MANIFEST_CACHE: Optional[Dict[str, tuple[int, int, Dict[str, Any]]]] = None
+_manifest_cache_lock = threading.Lock()
+_manifest_cache_dirty = False
+# Keys touched since the last flush; anything else is pruned on write.
+_manifest_seen: set[str] = set()
+
+
+def _manifest_cache() -> Dict[str, tuple[int, int, Dict[str, Any]]]:
+    global _MANIFEST_CACHE
+    if _MANIFEST_CACHE is None:
+        # The Steam and Epic scans run on separate threads.
+        with _manifest_cache_lock:
+            if _MANIFEST_CACHE is None:
+                _MANIFEST_CACHE = _load_manifest_cache()
+    return _MANIFEST_CACHE
+
+
+def _cached_manifest(path: Path, parse: Callable[[Path], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    global _manifest_cache_dirty
+    try:
+        st = path.stat()
+    except OSError as exc:
+        _LOGGER.error("Failed to stat manifest %s: %s", path, exc)
+        return None
+    cache = _manifest_cache()
+    key = str(path)
+    _manifest_seen.add(key)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = parse(path)
+    if data is not None:
+        cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _manifest_cache_dirty = True
     return data
 
 
-def _read_vdf(path: Path) -> Dict[str, Any]:
+def _flush_manifest_cache() -> None:
+    global _manifest_cache_dirty
+    cache = _MANIFEST_CACHE
+    if cache is None:
+        return
+    stale = cache.keys() - _manifest_seen
+    for key in stale:
+        del cache[key]
+    _manifest_seen.clear()
+    if stale:
+        _manifest_cache_dirty = True
+    if not _manifest_cache_dirty:
+        return
+    tmp_path = MANIFEST_CACHE_FILE.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as fh:
+            pickle.dump(cache, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, MANIFEST_CACHE_FILE)
+    except OSError as exc:
+        _LOGGER.error("Failed to write manifest cache %s: %s", MANIFEST_CACHE_FILE, exc)
+        return
+    _manifest_cache_dirty = False
+
+
+def _parse_vdf_file(path: Path) -> Optional[Dict[str, Any]]:
     try:
         text = path.read_text(encoding="utf-8", errors="ignore")
     except OSError as exc:
         _LOGGER.error("Failed to read VDF %s: %s", path, exc)
-        return {}
+        return None
     return parse_vdf(text)
 
 
+def _read_vdf(path: Path) -> Dict[str, Any]:
+    return _cached_manifest(path, _parse_vdf_file) or {}
+
+
+def _parse_acf_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Extract ``appid``/``name``/``installdir`` from an app manifest.
+
+    Falls back to the full parser when a field is missing, e.g. a name that
+    only lives under ``UserConfig``.
+    """
+
+    try:
+        raw = path.read_bytes()
+    except OSError as exc:
+        _LOGGER.error("Failed to read VDF %s: %s", path, exc)
+        return None
+    fields: Dict[bytes, bytes] = {}
+    for match in _ACF_PAIR_RE.finditer(raw):
+        key, value = match.groups()
+        if key in _ACF_FIELDS and key not in fields:
+            fields[key] = value
+            if len(fields) == len(_ACF_FIELDS):
+                break
+    if len(fields) < len(_ACF_FIELDS):
+        return parse_vdf(raw.decode("utf-8", errors="ignore"))
+    return {"AppState": {key.decode(): _acf_text(value) for key, value in fields.items()}}
+
+
+def _acf_text(value: bytes) -> str:
+    text = value.decode("utf-8", errors="ignore")
+    return _VDF_ESCAPE_RE.sub(r"\1", text) if "\\" in text else text
+
+
+def _read_acf(path: Path) -> Dict[str, Any]:
+    return _cached_manifest(path, _parse_acf_file) or {}
+
+
+def _parse_epic_file(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8", errors="ignore"))
+    except (OSError, json.JSONDecodeError) as exc:
+        _LOGGER.error("Failed to parse Epic manifest %s: %s", path, exc)
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def _steam_registry_paths() -> List[Path]:
     paths: List[Path] = []
     if not sys.platform.startswith("win"):
@@ -160,23 +284,48 @@ def _library_paths(steam_root: Path) -> List[Path]:
     return library_paths
 
 
+def _first_exe(folder: str) -> Optional[str]:
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(".exe") and entry.is_file():
+                return entry.path
+    return None
+
+
 def _guess_fallback_exe(folder: Path) -> Optional[str]:
-    if not folder.exists() or not folder.is_dir():
+    try:
+        found = _first_exe(str(folder))
+        if found:
+            return found
+        with os.scandir(folder) as entries:
+            children = [entry.path for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    exe_candidates = sorted(folder.glob("*.exe"))
-    if not exe_candidates:
-        try:
-            children = list(folder.iterdir())
-        except OSError as exc:
-            _LOGGER.error("Failed to enumerate %s: %s", folder, exc)
-            return None
-        for child in children:
-            if child.is_dir():
-                nested = sorted(child.glob("*.exe"))
-                if nested:
-                    return str(nested[0])
+    except OSError as exc:
+        _LOGGER.error("Failed to enumerate %s: %s", folder, exc)
         return None
-    return str(exe_candidates[0])
+    for child in children:
+        try:
+            found = _first_exe(child)
+        except OSError:
+            continue
+        if found:
+            return found
+    return None
+
+
+def _iter_manifests(library: Path) -> List[Path]:
+    """Return ``appmanifest_*.acf`` files in dirent order (empty if the library is missing)."""
+
+    try:
+        with os.scandir(library) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")
+            ]
+    except OSError:
+        return []
 
 
 def scan_steam(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
@@ -184,54 +333,60 @@ def scan_steam(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
     seen = set()
 
     roots = _steam_registry_paths()
-    for root in roots:
-        steamapps_dir = root / "steamapps"
-        libraries = [steamapps_dir]
-        libraries.extend(Path(path) / "steamapps" for path in _library_paths(root))
-
-        for library in libraries:
-            if not library.exists():
-                continue
-            for manifest in sorted(library.glob("appmanifest_*.acf")):
-                if len(results) >= max_items:
-                    return results
-                data = _read_vdf(manifest)
-                app_state = data.get("AppState") if isinstance(data, dict) else None
-                node = app_state if isinstance(app_state, dict) else data
-                if not isinstance(node, dict):
-                    continue
-                appid = str(node.get("appid", "")).strip()
-                name = (node.get("name") or node.get("UserConfig", {}).get("name")) if isinstance(node, dict) else None
-                install_dir = node.get("installdir") if isinstance(node, dict) else None
-                if not (appid and name and install_dir):
-                    continue
-                key = ("steam", appid)
-                if key in seen:
-                    continue
-                seen.add(key)
-                install_path = library / "common" / install_dir
-                fallback = _guess_fallback_exe(install_path)
-                results.append(
-                    {
-                        "name": name,
-                        "exec_path": URI_TEMPLATES["steam"].format(id=appid),
-                        "kind": "steam",
-                        "steam_appid": appid,
-                        "tags": ["Steam"],
-                        "fallback_exe": fallback,
-                    }
-                )
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+        for root in roots:
+            steamapps_dir = root / "steamapps"
+            libraries = [steamapps_dir]
+            libraries.extend(Path(path) / "steamapps" for path in _library_paths(root))
+
+            for library in libraries:
+                manifests = _iter_manifests(library)
+                futures = [pool.submit(_read_acf, manifest) for manifest in manifests]
+                for future in futures:
+                    if len(results) >= max_items:
+                        for pending in futures:
+                            pending.cancel()
+                        return results
+                    data = future.result()
+                    app_state = data.get("AppState") if isinstance(data, dict) else None
+                    node = app_state if isinstance(app_state, dict) else data
+                    if not isinstance(node, dict):
+                        continue
+                    appid = str(node.get("appid", "")).strip()
+                    name = (node.get("name") or node.get("UserConfig", {}).get("name")) if isinstance(node, dict) else None
+                    install_dir = node.get("installdir") if isinstance(node, dict) else None
+                    if not (appid and name and install_dir):
+                        continue
+                    key = ("steam", appid)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    install_path = library / "common" / install_dir
+                    fallback = _guess_fallback_exe(install_path)
+                    results.append(
+                        {
+                            "name": name,
+                            "exec_path": STEAM_URI_PREFIX + appid,
+                            "kind": "steam",
+                            "steam_appid": appid,
+                            "tags": ["Steam"],
+                            "fallback_exe": fallback,
+                        }
+                    )
     return results
 
 
+_EPIC_MANIFEST_SUFFIXES = (".json", ".item", ".manifest")
+
+
 def _epic_manifest_paths() -> List[Path]:
     base = Path(os.environ.get("PROGRAMDATA", r"C:\\ProgramData"))
     manifests_dir = base / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
-    if manifests_dir.exists():
-        return sorted(manifests_dir.glob("*.json")) + sorted(manifests_dir.glob("*.item")) + sorted(
-            manifests_dir.glob("*.manifest")
-        )
-    return []
+    try:
+        with os.scandir(manifests_dir) as entries:
+            return [Path(entry.path) for entry in entries if entry.name.endswith(_EPIC_MANIFEST_SUFFIXES)]
+    except OSError:
+        return []
 
 
 def scan_epic(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
@@ -239,10 +394,8 @@ def scan_epic(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
     for manifest_path in _epic_manifest_paths():
         if len(results) >= max_items:
             break
-        try:
-            data = json.loads(manifest_path.read_text(encoding="utf-8", errors="ignore"))
-        except (OSError, json.JSONDecodeError) as exc:
-            _LOGGER.error("Failed to parse Epic manifest %s: %s", manifest_path, exc)
+        data = _cached_manifest(manifest_path, _parse_epic_file)
+        if data is None:
             continue
         app_name = data.get("AppName") or data.get("CatalogItemId")
         display_name = data.get("DisplayName") or data.get("AppTitle")
@@ -253,7 +406,7 @@ def scan_epic(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
         results.append(
             {
                 "name": display_name,
-                "exec_path": URI_TEMPLATES["epic"].format(name=app_name),
+                "exec_path": EPIC_URI_PREFIX + str(app_name) + EPIC_URI_SUFFIX,
                 "kind": "epic",
                 "epic_appname": app_name,
                 "tags": ["Epic"],
@@ -264,19 +417,31 @@ def scan_epic(max_items: int = MAX_DEFAULT_ITEMS) -> List[Dict[str, Any]]:
 
 
 def initial_discovery(limit: int = 300) -> List[Dict[str, Any]]:
-    steam = scan_steam(limit)
-    remaining = max(0, limit - len(steam))
-    epic = scan_epic(remaining)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        steam_future = pool.submit(scan_steam, limit)
+        epic_future = pool.submit(scan_epic, limit)
+        steam = steam_future.result()
+        epic = epic_future.result()
 
-    combined = steam + epic
+    combined = (steam + epic)[:limit]
     deduped: Dict[tuple[str, str], Dict[str, Any]] = {}
     for entry in combined:
-        key = (entry.get("kind", "path"), entry.get("steam_appid") or entry.get("epic_appname") or entry.get("exec_path"))
-        if key not in deduped:
-            deduped[key] = entry
+        deduped.setdefault(_entry_key(entry), entry)
+    _flush_manifest_cache()
     return list(deduped.values())
 
 
+def _entry_key(entry: Dict[str, Any]) -> tuple[str, str]:
+    """``discovery_key`` for a raw discovery dict, without building a Game."""
+
+    kind = entry.get("kind", "exe")
+    if kind == "steam" and entry.get("steam_appid"):
+        return ("steam", entry["steam_appid"])
+    if kind == "epic" and entry.get("epic_appname"):
+        return ("epic", entry["epic_appname"])
+    return ("path", entry["exec_path"].lower())
+
+
 def to_game(entry: Dict[str, Any]) -> Game:
     game = Game(
         id=entry.get("id") or entry.get("steam_appid") or entry.get("epic_appname") or entry["exec_path"],
@@ -292,11 +457,11 @@ def to_game(entry: Dict[str, Any]) -> Game:
 
 
 def merge_discovery(games: Iterable[Dict[str, Any]]) -> List[Game]:
-    new_games = [to_game(entry) for entry in games]
-    unique: Dict[tuple[str, str], Game] = {}
-    for game in new_games:
-        unique[discovery_key(game)] = game
-    return list(unique.values())
+    # Deduplicate the dicts first so only survivors pay for Game construction.
+    unique: Dict[tuple[str, str], Dict[str, Any]] = {}
+    for entry in games:
+        unique[_entry_key(entry)] = entry
+    return [to_game(entry) for entry in unique.values()]
 
 
 __all__ = [
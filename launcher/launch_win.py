@@ -1,39 +1,95 @@
 """Windows specific helpers to launch executables and shortcuts."""
 from __future__ import annotations
 
+import json
 import logging
 import os
 import shlex
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - depends on platform
+    import pythoncom  # type: ignore
+    import win32com.client  # type: ignore
+except ImportError:  # pragma: no cover - depends on platform
+    pythoncom = None
+    win32com = None
 
 _LOGGER = logging.getLogger(__name__)
 
+ShortcutInfo = Tuple[Optional[str], Optional[str], Optional[str]]
+
+_COM_STATE = threading.local()
+
 URI_PREFIXES = ("steam://", "com.epicgames.launcher://")
+_URI_SCHEMES = frozenset(prefix[: -len("://")] for prefix in URI_PREFIXES)
 
 
 def _is_uri(path: str) -> bool:
-    return any(path.lower().startswith(prefix) for prefix in URI_PREFIXES)
+    # Only the scheme is case-folded, not the whole path.
+    end = path.find("://")
+    return end > 0 and path[:end].lower() in _URI_SCHEMES
 
 
-def _resolve_shortcut(path: Path) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-    """Resolve a Windows shortcut (.lnk) using PowerShell.
+def _wscript_shell() -> Any:
+    """Return a per-thread ``WScript.Shell`` COM object."""
 
-    Returns tuple of (target_path, arguments, working_directory).
-    """
+    shell = getattr(_COM_STATE, "shell", None)
+    if shell is None:
+        pythoncom.CoInitialize()
+        shell = win32com.client.Dispatch("WScript.Shell")
+        _COM_STATE.shell = shell
+    return shell
+
+
+def _resolve_shortcut_com(path: Path) -> ShortcutInfo:
+    lnk = _wscript_shell().CreateShortcut(str(path))
+    return lnk.TargetPath or None, lnk.Arguments or None, lnk.WorkingDirectory or None
+
+
+_RESOLVE_LNK_SCRIPT = """\
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+$sh = New-Object -ComObject WScript.Shell
+foreach ($p in $args) {
+    $lnk = $sh.CreateShortcut($p)
+    [pscustomobject]@{
+        Path = $p
+        TargetPath = $lnk.TargetPath
+        Arguments = $lnk.Arguments
+        WorkingDirectory = $lnk.WorkingDirectory
+    } | ConvertTo-Json -Compress
+}
+"""
+
+_resolve_lnk_script_path: Optional[Path] = None
+
+
+def _resolve_lnk_script() -> Path:
+    """Write the resolver script to the temp dir once per process."""
+
+    global _resolve_lnk_script_path
+    if _resolve_lnk_script_path is None:
+        script_path = Path(tempfile.gettempdir()) / "card_launcher_resolve_lnk.ps1"
+        try:
+            current = script_path.read_text(encoding="utf-8")
+        except OSError:
+            current = None
+        if current != _RESOLVE_LNK_SCRIPT:
+            script_path.write_text(_RESOLVE_LNK_SCRIPT, encoding="utf-8")
+        _resolve_lnk_script_path = script_path
+    return _resolve_lnk_script_path
 
-    if not sys.platform.startswith("win"):
-        return None, None, None
 
-    script = (
-        "$sh = New-Object -ComObject WScript.Shell;"
-        f"$lnk = $sh.CreateShortcut('{path.as_posix().replace("'", "''")}');"
-        "Write-Output $lnk.TargetPath;"
-        "Write-Output $lnk.Arguments;"
-        "Write-Output $lnk.WorkingDirectory;"
-    )
+def _resolve_shortcuts_powershell(paths: List[Path]) -> Dict[Path, ShortcutInfo]:
+    """Resolve many shortcuts with a single PowerShell process emitting JSON lines."""
+
+    results: Dict[Path, ShortcutInfo] = {path: (None, None, None) for path in paths}
+    if not paths:
+        return results
 
     try:
         completed = subprocess.run(
@@ -42,31 +98,81 @@ def _resolve_shortcut(path: Path) -> Tuple[Optional[str], Optional[str], Optiona
                 "-NoProfile",
                 "-ExecutionPolicy",
                 "Bypass",
-                "-Command",
-                script,
+                "-File",
+                str(_resolve_lnk_script()),
+                *(str(path) for path in paths),
             ],
             capture_output=True,
             text=True,
+            encoding="utf-8",
+            errors="replace",
             check=False,
         )
     except Exception as exc:  # pragma: no cover - defensive
-        _LOGGER.error("Failed to invoke PowerShell for shortcut %s: %s", path, exc)
-        return None, None, None
+        _LOGGER.error("Failed to invoke PowerShell for shortcuts %s: %s", paths, exc)
+        return results
 
     if completed.returncode != 0:
         _LOGGER.error(
-            "PowerShell failed to resolve shortcut %s: %s", path, completed.stderr.strip()
+            "PowerShell failed to resolve shortcuts %s: %s", paths, completed.stderr.strip()
+        )
+        return results
+
+    by_str = {str(path): path for path in paths}
+    for line in completed.stdout.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            _LOGGER.error("Unexpected PowerShell output while resolving shortcuts: %s", line)
+            continue
+        path = by_str.get(data.get("Path", ""))
+        if path is None:
+            continue
+        results[path] = (
+            data.get("TargetPath") or None,
+            data.get("Arguments") or None,
+            data.get("WorkingDirectory") or None,
         )
-        return None, None, None
+    return results
+
+
+def resolve_shortcuts(paths: Iterable[Path]) -> Dict[Path, ShortcutInfo]:
+    """Resolve Windows shortcuts (.lnk) in bulk.
+
+    Uses in-process COM when pywin32 is available, otherwise a single
+    PowerShell invocation for the whole batch. Maps each path to
+    (target_path, arguments, working_directory).
+    """
 
-    outputs = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
-    if not outputs:
-        return None, None, None
+    paths = list(paths)
+    if not sys.platform.startswith("win"):
+        return {path: (None, None, None) for path in paths}
+
+    results: Dict[Path, ShortcutInfo] = {}
+    pending: List[Path] = []
+    for path in paths:
+        if win32com is None:
+            pending.append(path)
+            continue
+        try:
+            results[path] = _resolve_shortcut_com(path)
+        except Exception as exc:
+            _LOGGER.warning("COM failed to resolve shortcut %s, retrying with PowerShell: %s", path, exc)
+            pending.append(path)
+    results.update(_resolve_shortcuts_powershell(pending))
+    return results
+
+
+def _resolve_shortcut(path: Path) -> ShortcutInfo:
+    """Resolve a Windows shortcut (.lnk).
+
+    Returns tuple of (target_path, arguments, working_directory).
+    """
 
-    target = outputs[0]
-    arguments = outputs[1] if len(outputs) > 1 else None
-    working_dir = outputs[2] if len(outputs) > 2 else None
-    return target or None, arguments or None, working_dir or None
+    return resolve_shortcuts([path])[path]
 
 
 def _merge_args(link_args: Optional[str], extra_args: Optional[str]) -> Optional[str]:
@@ -1,16 +1,22 @@
 """Data models and persistence for the launcher."""
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import Any, Iterable, List, Literal, Optional
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
 
-from pydantic import BaseModel, Field, ValidationError
+try:  # optional C accelerated encoder
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 APP_TITLE = "Card Launcher"
 SETTINGS_FILE = "settings.json"
 
 
-class Game(BaseModel):
+@dataclass(slots=True, eq=False)
+class Game:
     """Application/game entry managed by the launcher."""
 
     id: str
@@ -19,62 +25,162 @@ class Game(BaseModel):
     args: Optional[str] = None
     working_dir: Optional[str] = None
     favorite: bool = False
-    tags: List[str] = Field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
     cover: Optional[str] = None
     kind: Literal["exe", "lnk", "steam", "epic"] = "exe"
     steam_appid: Optional[str] = None
     epic_appname: Optional[str] = None
     run_as_admin: bool = False
     fallback_exe: Optional[str] = None
-
-    class Config:
-        validate_assignment = True
+    _search_blob: Optional[str] = field(default=None, init=False, repr=False)
 
     def display_tags(self) -> str:
         return ",".join(self.tags)
 
+    @property
+    def search_blob(self) -> str:
+        """Casefolded name/path/args/tags used for substring search (built lazily)."""
+        blob = self._search_blob
+        if blob is None:
+            blob = self._search_blob = (
+                f"{self.name}\0{self.exec_path}\0{self.args or ''}\0{','.join(self.tags)}".casefold()
+            )
+        return blob
+
+    def invalidate_search_blob(self) -> None:
+        self._search_blob = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _GAME_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Game":
+        if not isinstance(data, dict):
+            raise ValueError("Game entry must be an object")
+        missing = [name for name in _GAME_REQUIRED if name not in data]
+        if missing:
+            raise ValueError(f"Missing field '{missing[0]}'")
+        values = {name: data[name] for name in _GAME_FIELDS if name in data}
+        values["tags"] = list(values.get("tags") or [])
+        return cls(**values)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None) -> "Game":
+        values = {"tags": list(self.tags)}
+        if update:
+            values.update(update)
+        return replace(self, **values)
+
     def clone(self, **updates: Any) -> "Game":
-        if hasattr(self, "model_copy"):
-            return getattr(self, "model_copy")(update=updates)
-        return getattr(self, "copy")(update=updates)
+        return self.model_copy(update=updates)
 
 
-class AppSettings(BaseModel):
+_GAME_FIELDS = tuple(f.name for f in fields(Game) if f.init)
+_GAME_REQUIRED = ("id", "name", "exec_path")
+
+
+@dataclass(slots=True, eq=False)
+class AppSettings:
     dark: bool = True
     click_to_launch: bool = True
     sort: str = "created"
-    games: List[Game] = Field(default_factory=list)
+    games: List[Game] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = self._shallow_dict()
+        payload["games"] = [game.to_dict() for game in self.games]
+        return payload
+
+    def _shallow_dict(self) -> Dict[str, Any]:
+        # Games stay as objects here; the JSON encoders expand them via ``_encode``.
+        return {"dark": self.dark, "click_to_launch": self.click_to_launch, "sort": self.sort, "games": self.games}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AppSettings":
+        if not isinstance(data, dict):
+            raise ValueError("JSON root must be an object")
+        return cls(
+            dark=bool(data.get("dark", True)),
+            click_to_launch=bool(data.get("click_to_launch", True)),
+            sort=str(data.get("sort", "created")),
+            games=[Game.from_dict(item) for item in data.get("games") or []],
+        )
+
+    @classmethod
+    def model_validate_json(cls, data: str) -> "AppSettings":
+        return cls.from_dict(json.loads(data))
+
+    def model_dump_json(self, indent: int = 2, ensure_ascii: bool = False) -> str:
+        if orjson is not None and indent in (None, 2) and not ensure_ascii:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self._shallow_dict(), default=_encode, option=option).decode("utf-8")
+        return json.dumps(self._shallow_dict(), default=_encode, indent=indent, ensure_ascii=ensure_ascii)
 
-    class Config:
-        validate_assignment = True
+
+def _encode(value: Any) -> Dict[str, Any]:
+    if isinstance(value, Game):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 class SettingsStore:
-    """Persist and mutate launcher settings/games."""
+    """Persist and mutate launcher settings/games.
+
+    Mutations mark the store dirty. Without a ``schedule`` callback they are
+    written immediately; with one (e.g. ``QTimer.singleShot``) bursts of
+    mutations coalesce into a single write. Call ``flush`` before exiting.
+    """
 
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, schedule: Optional[Callable[[Callable[[], None]], Any]] = None):
         self.base_dir = base_dir
         self.settings_path = base_dir / SETTINGS_FILE
         self.settings = self._load()
+        self._reindex()
+        self._schedule = schedule
+        self._dirty = False
+        self._save_pending = False
+        # Bumped on every mutation so callers can invalidate derived caches.
+        self.version = 0
 
     # ----- Persistence -------------------------------------------------
     def _load(self) -> AppSettings:
         if self.settings_path.exists():
             try:
                 data = self.settings_path.read_text(encoding="utf-8")
-                if hasattr(AppSettings, "model_validate_json"):
-                    return AppSettings.model_validate_json(data)
-                return AppSettings.parse_raw(data)  # type: ignore[attr-defined]
-            except (OSError, ValidationError):
+                return AppSettings.model_validate_json(data)
+            except (OSError, ValueError):
                 pass
         return AppSettings()
 
+    def _reindex(self) -> None:
+        games = self.settings.games
+        self._id_index: Dict[str, int] = {game.id: idx for idx, game in enumerate(games)}
+        self._key_index: Dict[tuple[str, str], str] = {discovery_key(game): game.id for game in games}
+
+    def _index_new(self, game: Game, key: Optional[tuple[str, str]] = None) -> None:
+        self._id_index[game.id] = len(self.settings.games) - 1
+        self._key_index[key or discovery_key(game)] = game.id
+
     def save(self) -> None:
-        if hasattr(self.settings, "model_dump_json"):
-            payload = self.settings.model_dump_json(indent=2, ensure_ascii=False)
-        else:
-            payload = self.settings.json(indent=2, ensure_ascii=False)  # type: ignore[attr-defined]
+        payload = self.settings.model_dump_json(indent=2, ensure_ascii=False)
         self.settings_path.write_text(payload, encoding="utf-8")
+        self._dirty = False
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.save()
+
+    def _flush_scheduled(self) -> None:
+        self._save_pending = False
+        self.flush()
+
+    def _mark_dirty(self) -> None:
+        self.version += 1
+        self._dirty = True
+        if self._schedule is None:
+            self.flush()
+        elif not self._save_pending:
+            self._save_pending = True
+            self._schedule(self._flush_scheduled)
 
     # ----- Game access -------------------------------------------------
     @property
@@ -82,46 +188,69 @@ class SettingsStore:
         return self.settings.games
 
     def add(self, game: Game) -> None:
+        game.invalidate_search_blob()
         self.settings.games.append(game)
-        self.save()
+        self._index_new(game)
+        self._mark_dirty()
 
     def add_many(self, games: Iterable[Game]) -> int:
         added = 0
+        key_index = self._key_index
         for game in games:
-            if not self.contains(game):
+            key = discovery_key(game)
+            if key not in key_index:
+                game.invalidate_search_blob()
                 self.settings.games.append(game)
+                self._index_new(game, key)
                 added += 1
         if added:
-            self.save()
+            self._mark_dirty()
         return added
 
     def update(self, updated: Game) -> None:
-        for idx, game in enumerate(self.settings.games):
-            if game.id == updated.id:
-                self.settings.games[idx] = updated
-                self.save()
-                break
+        idx = self._id_index.get(updated.id)
+        if idx is None:
+            return
+        old_key = discovery_key(self.settings.games[idx])
+        # Callers may have edited the game in place, so drop its cached blob.
+        updated.invalidate_search_blob()
+        self.settings.games[idx] = updated
+        new_key = discovery_key(updated)
+        if new_key != old_key:
+            # Another game may share the old key, so rebuild rather than patch.
+            self._reindex()
+        self._mark_dirty()
 
     def delete(self, ids: Iterable[str]) -> None:
         ids_set = set(ids)
         self.settings.games = [g for g in self.settings.games if g.id not in ids_set]
-        self.save()
+        self._reindex()
+        self._mark_dirty()
 
     def contains(self, candidate: Game) -> bool:
-        key = discovery_key(candidate)
-        return any(discovery_key(g) == key for g in self.settings.games)
+        return discovery_key(candidate) in self._key_index
 
     def by_id(self, game_id: str) -> Optional[Game]:
-        for game in self.settings.games:
-            if game.id == game_id:
-                return game
-        return None
+        idx = self._id_index.get(game_id)
+        if idx is None:
+            return None
+        return self.settings.games[idx]
 
     def all_tags(self) -> List[str]:
         tags = {tag for game in self.settings.games for tag in game.tags}
         return sorted(tags)
 
 
+_KIND_PREFIXES = (("steam://", "steam"), ("com.epicgames.launcher://", "epic"))
+
+
+def detect_kind(exec_path: str) -> str:
+    for prefix, kind in _KIND_PREFIXES:
+        if exec_path.startswith(prefix):
+            return kind
+    return "lnk" if exec_path[-4:].lower() == ".lnk" else "exe"
+
+
 def discovery_key(game: Game) -> tuple[str, str]:
     if game.kind == "steam" and game.steam_appid:
         return ("steam", game.steam_appid)
@@ -135,5 +264,6 @@ __all__ = [
     "Game",
     "AppSettings",
     "SettingsStore",
+    "detect_kind",
     "discovery_key",
 ]
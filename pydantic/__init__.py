@@ -3,7 +3,13 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+
+try:  # optional C accelerated encoder
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 T = TypeVar("T", bound="BaseModel")
 
@@ -24,6 +30,18 @@ def Field(*, default: Any = None, default_factory: Optional[Any] = None) -> _Fie
 
 _MISSING = object()
 
+# (origin, args, model class or None) for a resolved annotation.
+_TypeInfo = Tuple[Any, Tuple[Any, ...], Optional[type]]
+
+
+@lru_cache(maxsize=None)
+def _type_info(annotation: Any) -> _TypeInfo:
+    model = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+    return get_origin(annotation), get_args(annotation), model
+
+
+_NO_INFO: _TypeInfo = (None, (), None)
+
 
 class BaseModel:
     __field_defaults__: Dict[str, _FieldInfo] = {}
@@ -41,50 +59,143 @@ class BaseModel:
             else:
                 defaults[name] = _FieldInfo(default=_MISSING)
         cls.__field_defaults__ = defaults
+        if "__init__" not in cls.__dict__:
+            # Compiled on first instantiation so forward references can resolve.
+            cls.__init__ = BaseModel._compiling_init  # type: ignore[method-assign]
+
+    def _compiling_init(self, **data: Any) -> None:
+        cls = self.__class__
+        if cls.__init__ is BaseModel._compiling_init:
+            cls.__init__ = cls._compile_init()  # type: ignore[method-assign]
+            cls.__init__(self, **data)
+        else:  # subclass still waiting for its own compiled __init__
+            BaseModel.__init__(self, **data)
+
+    @classmethod
+    def _compile_init(cls) -> Any:
+        """Generate a specialised ``__init__`` with field conversions inlined."""
+
+        schema = cls._field_schema()
+        ns: Dict[str, Any] = {"_MISSING": _MISSING, "ValidationError": ValidationError}
+        lines = ["def __init__(self, **data):"]
+        for idx, (name, info) in enumerate(cls.__field_defaults__.items()):
+            lines.append(f"    v = data.pop({name!r}, _MISSING)")
+            lines.append("    if v is _MISSING:")
+            if info.default_factory is not None:
+                ns[f"_factory{idx}"] = info.default_factory
+                lines.append(f"        v = _factory{idx}()")
+            elif info.default is _MISSING:
+                lines.append(f"        raise ValidationError(\"Missing field '{name}'\")")
+            else:
+                ns[f"_default{idx}"] = info.default
+                lines.append(f"        v = _default{idx}")
+            lines.extend(cls._conversion_source(schema[idx][1:], idx, ns))
+            lines.append(f"    self.{name} = v")
+        lines.append("    for k, v in data.items():")
+        lines.append("        setattr(self, k, v)")
+        exec("\n".join(lines), ns)
+        return ns["__init__"]
+
+    @classmethod
+    def _conversion_source(cls, info: _TypeInfo, idx: int, ns: Dict[str, Any]) -> List[str]:
+        origin, args, model = info
+        if origin is None:
+            if model is not None:
+                ns[f"_model{idx}"] = model
+                return [f"    if isinstance(v, dict): v = _model{idx}(**v)"]
+            return []
+        if origin in (list, List):
+            inner_origin, _, inner_model = _type_info(args[0]) if args else _NO_INFO
+            if inner_model is not None:
+                ns[f"_model{idx}"] = inner_model
+                return [
+                    f"    v = [] if v is None else [_model{idx}(**x) if isinstance(x, dict) else x for x in v]"
+                ]
+            if inner_origin is None:
+                return ["    v = [] if v is None else list(v)"]
+        elif origin is Union and len(args) == 2 and type(None) in args:
+            inner_origin, _, inner_model = _type_info(args[0] if args[1] is type(None) else args[1])
+            if inner_model is not None:
+                ns[f"_model{idx}"] = inner_model
+                return [f"    if isinstance(v, dict): v = _model{idx}(**v)"]
+            if inner_origin is None:
+                return []
+        elif origin is Literal:
+            return []
+        # anything more exotic goes through the generic converter
+        ns[f"_info{idx}"] = info
+        ns["_convert"] = cls._convert_value
+        return [f"    v = _convert(_info{idx}, v)"]
+
+    @classmethod
+    def _field_annotations(cls) -> Dict[str, Any]:
+        # Resolve postponed (string) annotations once per class.
+        resolved = cls.__dict__.get("__resolved_annotations__")
+        if resolved is None:
+            try:
+                resolved = get_type_hints(cls)
+            except Exception:
+                resolved = dict(getattr(cls, "__annotations__", {}))
+            cls.__resolved_annotations__ = resolved
+        return resolved
+
+    @classmethod
+    def _field_schema(cls) -> List[Tuple[str, Any, Tuple[Any, ...], Optional[type]]]:
+        """Per-class ``(name, origin, args, model)`` rows, computed once."""
+
+        schema = cls.__dict__.get("__field_schema__")
+        if schema is None:
+            annotations = cls._field_annotations()
+            schema = []
+            for name in cls.__field_defaults__:
+                annotation = annotations.get(name)
+                info = _NO_INFO if annotation is None else _type_info(annotation)
+                schema.append((name, *info))
+            cls.__field_schema__ = schema
+        return schema
 
     def __init__(self, **data: Any) -> None:
-        annotations = getattr(self.__class__, "__annotations__", {})
-        for name, info in self.__class__.__field_defaults__.items():
+        defaults = self.__class__.__field_defaults__
+        for name, *info in self._field_schema():
             if name in data:
                 value = data.pop(name)
             else:
-                if info.default_factory is not None:
-                    value = info.default_factory()
-                elif info.default is _MISSING:
+                field = defaults[name]
+                if field.default_factory is not None:
+                    value = field.default_factory()
+                elif field.default is _MISSING:
                     raise ValidationError(f"Missing field '{name}'")
                 else:
-                    value = info.default
-            value = self._convert_value(annotations.get(name), value)
+                    value = field.default
+            value = self._convert_value(info, value)
             setattr(self, name, value)
         for name, value in data.items():
             setattr(self, name, value)
 
     @classmethod
-    def _convert_value(cls, annotation: Any, value: Any) -> Any:
-        if annotation is None:
-            return value
-        origin = get_origin(annotation)
+    def _convert_value(cls, info: _TypeInfo, value: Any) -> Any:
+        origin, args, model = info
         if origin in (list, List):
-            inner = get_args(annotation)[0] if get_args(annotation) else Any
             if value is None:
                 return []
+            inner = _type_info(args[0]) if args else _NO_INFO
             return [cls._convert_value(inner, item) for item in value]
         if origin in (Union, Optional):  # type: ignore[name-defined]
-            for arg in get_args(annotation):
+            for arg in args:
                 if arg is type(None):
                     if value is None:
                         return None
                     continue
                 try:
-                    return cls._convert_value(arg, value)
+                    return cls._convert_value(_type_info(arg), value)
                 except ValidationError:
                     continue
             return value
-        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
-            if isinstance(value, annotation):
+        if model is not None:
+            if isinstance(value, model):
                 return value
             if isinstance(value, dict):
-                return annotation(**value)
+                return model(**value)
         return value
 
     def dict(self) -> Dict[str, Any]:
@@ -102,7 +213,12 @@ class BaseModel:
         return value
 
     def model_dump_json(self, indent: int = 2, ensure_ascii: bool = False) -> str:
-        return json.dumps(self.dict(), indent=indent, ensure_ascii=ensure_ascii)
+        # Models are encoded field by field via ``default`` so no intermediate
+        # dict tree is built. orjson only supports two-space indents and UTF-8.
+        if orjson is not None and indent in (None, 2) and not ensure_ascii:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self, default=_encode, option=option).decode("utf-8")
+        return json.dumps(self, default=_encode, indent=indent, ensure_ascii=ensure_ascii)
 
     def json(self, indent: int = 2, ensure_ascii: bool = False) -> str:
         return self.model_dump_json(indent=indent, ensure_ascii=ensure_ascii)
@@ -126,3 +242,9 @@ class BaseModel:
 
     def copy(self: T, update: Optional[Dict[str, Any]] = None) -> T:
         return self.model_copy(update=update)
+
+
+def _encode(value: Any) -> Dict[str, Any]:
+    if isinstance(value, BaseModel):
+        return {name: getattr(value, name, None) for name, *_ in value._field_schema()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
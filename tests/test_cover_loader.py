@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+from PySide6 import QtCore, QtGui
+
+from utils import cover_loader
+
+
+@pytest.fixture
+def cover(tmp_path):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    img = QtGui.QImage(400, 600, QtGui.QImage.Format_RGB32)
+    img.fill(QtGui.QColor(10, 20, 30))
+    path = tmp_path / "cover.png"
+    assert img.save(str(path))
+    yield app, str(path)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def test_shared_and_late_requests_reach_every_callback(cover):
+    app, path = cover
+    first, second, late = [], [], []
+    cover_loader.request_cover(path, 240, lambda p, img: first.append(img.width()))
+    cover_loader.request_cover(path, 240, lambda p, img: second.append(img.width()))
+    # The worker has emitted but the queued result has not been delivered yet.
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    cover_loader.request_cover(path, 240, lambda p, img: late.append(img.width()))
+    app.processEvents()
+
+    assert first == second == late == [240]
+    assert not cover_loader._pending
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import pickle
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -63,3 +64,88 @@ def test_scan_epic_extracts_app_name(tmp_path, monkeypatch):
     assert app["epic_appname"] == "ExampleApp"
     assert app["name"] == "Example App"
     assert app["exec_path"] == "com.epicgames.launcher://apps/ExampleApp?action=launch"
+
+
+def test_parse_vdf_handles_nested_sections():
+    text = (
+        '"AppState"\n'
+        '{\n'
+        '    "appid" "42"\n'
+        '    // comment line\n'
+        '    "UserConfig"\n'
+        '    {\n'
+        '        "name" "Nested \\"Name\\""\n'
+        '        "MountedDepots" { "1" "2" }\n'
+        '    }\n'
+        '    "installdir" "Inner"\n'
+        '}\n'
+    )
+    data = discovery.parse_vdf(text)
+    app_state = data["AppState"]
+    assert app_state["appid"] == "42"
+    assert app_state["installdir"] == "Inner"
+    assert app_state["UserConfig"]["name"] == 'Nested "Name"'
+    assert app_state["UserConfig"]["MountedDepots"] == {"1": "2"}
+
+
+def test_read_vdf_reuses_cached_parse_until_file_changes(tmp_path, monkeypatch):
+    manifest = tmp_path / "appmanifest_1.acf"
+    manifest.write_text('"AppState" { "appid" "1" }', encoding="utf-8")
+    monkeypatch.setattr(discovery, "_MANIFEST_CACHE", {})
+    calls = []
+    real_parse = discovery.parse_vdf
+    monkeypatch.setattr(discovery, "parse_vdf", lambda text: calls.append(text) or real_parse(text))
+
+    assert discovery._read_vdf(manifest)["AppState"]["appid"] == "1"
+    assert discovery._read_vdf(manifest)["AppState"]["appid"] == "1"
+    assert len(calls) == 1
+
+    manifest.write_text('"AppState" { "appid" "22" }', encoding="utf-8")
+    assert discovery._read_vdf(manifest)["AppState"]["appid"] == "22"
+    assert len(calls) == 2
+
+
+def test_manifest_cache_loads_lazily_and_prunes_unseen_entries(tmp_path, monkeypatch):
+    manifest = tmp_path / "appmanifest_1.acf"
+    manifest.write_text('"AppState" { "appid" "1" }', encoding="utf-8")
+    st = manifest.stat()
+    cache_file = tmp_path / "manifests.pickle"
+    stored = {
+        str(manifest): (st.st_mtime_ns, st.st_size, {"AppState": {"appid": "cached"}}),
+        str(tmp_path / "gone.acf"): (0, 0, {}),
+    }
+    cache_file.write_bytes(pickle.dumps(stored))
+    monkeypatch.setattr(discovery, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(discovery, "MANIFEST_CACHE_FILE", cache_file)
+    monkeypatch.setattr(discovery, "_MANIFEST_CACHE", None)
+    monkeypatch.setattr(discovery, "_manifest_seen", set())
+    monkeypatch.setattr(discovery, "_manifest_cache_dirty", False)
+
+    assert discovery._read_vdf(manifest)["AppState"]["appid"] == "cached"
+    discovery._flush_manifest_cache()
+
+    assert set(pickle.loads(cache_file.read_bytes())) == {str(manifest)}
+
+
+def test_parse_vdf_handles_deep_nesting_without_recursion():
+    depth = 5000
+    text = '"k" {' * depth + '"leaf" "1"' + "}" * depth
+    node = discovery.parse_vdf(text)
+    for _ in range(depth):
+        node = node["k"]
+    assert node == {"leaf": "1"}
+
+
+def test_parse_acf_file_matches_full_parse(tmp_path):
+    manifest = tmp_path / "appmanifest_7.acf"
+    manifest.write_text(
+        '"AppState"\n{\n\t"appid"\t\t"7"\n\t"name"\t\t"Quote \\"Game\\""\n'
+        '\t"installdir"\t\t"Q"\n\t"UserConfig"\n\t{\n\t\t"name"\t\t"Other"\n\t}\n}\n',
+        encoding="utf-8",
+    )
+    full = discovery.parse_vdf(manifest.read_text(encoding="utf-8"))["AppState"]
+    fast = discovery._parse_acf_file(manifest)["AppState"]
+    assert fast == {key: full[key] for key in ("appid", "name", "installdir")}
+
+    manifest.write_text('"AppState" { "appid" "8" "UserConfig" { "name" "Inner" } }', encoding="utf-8")
+    assert discovery._parse_acf_file(manifest)["AppState"]["UserConfig"]["name"] == "Inner"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from launcher import launch_win
+
+
+@pytest.fixture
+def powershell(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setattr(launch_win, "win32com", None)
+    monkeypatch.setattr(launch_win, "_resolve_lnk_script_path", tmp_path / "resolve.ps1")
+    calls = []
+
+    def install(stdout: str, returncode: int = 0):
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, returncode, stdout=stdout, stderr="boom")
+        monkeypatch.setattr(launch_win.subprocess, "run", fake_run)
+        return calls
+
+    return install
+
+
+def test_resolve_shortcuts_matches_json_lines_to_paths(powershell):
+    a, b, c = Path("C:/a.lnk"), Path("C:/b.lnk"), Path("C:/c.lnk")
+    stdout = "\n".join(
+        [
+            json.dumps({"Path": str(a), "TargetPath": "C:/a.exe", "Arguments": "-x", "WorkingDirectory": "C:/"}),
+            "not json",
+            "",
+            json.dumps({"Path": "C:/unknown.lnk", "TargetPath": "C:/u.exe"}),
+            json.dumps({"Path": str(c), "TargetPath": "C:/c.exe", "Arguments": "", "WorkingDirectory": ""}),
+        ]
+    )
+    calls = powershell(stdout)
+
+    results = launch_win.resolve_shortcuts([a, b, c])
+
+    assert len(calls) == 1 and calls[0][-3:] == [str(a), str(b), str(c)]
+    assert results == {
+        a: ("C:/a.exe", "-x", "C:/"),
+        b: (None, None, None),
+        c: ("C:/c.exe", None, None),
+    }
+
+
+def test_resolve_shortcuts_returns_empty_info_when_powershell_fails(powershell):
+    a = Path("C:/a.lnk")
+    powershell(json.dumps({"Path": str(a), "TargetPath": "C:/a.exe"}), returncode=1)
+
+    assert launch_win.resolve_shortcuts([a]) == {a: (None, None, None)}
+    assert launch_win._resolve_shortcut(a) == (None, None, None)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from launcher.models import Game
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(sys, "argv", [str(tmp_path / "app.py")])
+    from ui import main_window
+
+    win = main_window.MainWindow()
+    win.store.add_many(
+        [Game(id=str(i), name=f"Game {i}", exec_path=f"C:/g{i}.exe") for i in range(60)]
+    )
+    win.show()
+    win._do_refresh_grid()
+    app.processEvents()
+    yield main_window, win
+    win.close()
+
+
+def test_scrolling_keeps_timer_intervals(window):
+    main_window, win = window
+    bar = win.scroll.verticalScrollBar()
+    bar.setValue(bar.maximum() // 2)
+    assert bar.value() > 0
+    assert win._cover_timer.interval() == main_window.COVER_LOAD_DELAY_MS
+    assert win._smooth_timer.interval() == main_window.SMOOTH_RESCALE_DELAY_MS
+
+
+def test_grid_keeps_only_a_window_of_rows(window):
+    main_window, win = window
+    bar = win.scroll.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    cols, ids, first, last = win._last_layout
+    assert first > 0 and last == -(-len(ids) // cols)
+    assert "0" not in win._cards and "59" in win._cards
+    assert len(win._cards) <= (2 * main_window.OVERSCAN_ROWS + 3) * cols
+    bar.setValue(0)
+    assert "0" in win._cards and "59" not in win._cards
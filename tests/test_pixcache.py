@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+from PySide6 import QtCore, QtGui
+
+from utils.pixcache import PixCache
+
+
+def test_request_calls_plain_callables_for_shared_decodes(tmp_path):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    img = QtGui.QImage(300, 450, QtGui.QImage.Format_RGB32)
+    img.fill(QtGui.QColor(200, 100, 50))
+    path = tmp_path / "cover.png"
+    assert img.save(str(path))
+    cache = PixCache()
+    seen = []
+
+    def on_loaded(p, image):
+        seen.append((p, image.width()))
+
+    assert cache.request(str(path), 150, on_loaded) is None
+    assert cache.request(str(path), 150, lambda p, image: seen.append(("lambda", image.width()))) is None
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    assert seen == [(str(path), 150), ("lambda", 150)]
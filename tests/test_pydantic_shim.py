@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+import pydantic
+from pydantic import BaseModel, Field, ValidationError
+
+
+class Item(BaseModel):
+    id: str
+    tags: List[str] = Field(default_factory=list)
+    cover: Optional[str] = None
+
+
+class Shelf(BaseModel):
+    items: List[Item] = Field(default_factory=list)
+    best: Optional[Item] = None
+    title: str = "Shelf"
+
+
+def test_missing_required_field_raises_validation_error():
+    with pytest.raises(ValidationError, match="'id'"):
+        Item()
+
+
+def test_nested_models_are_converted_from_dicts():
+    shelf = Shelf(items=[{"id": "1", "tags": None}, Item(id="2")], best={"id": "3"})
+    assert [type(item) for item in shelf.items] == [Item, Item]
+    assert shelf.items[0].tags == []
+    assert isinstance(shelf.best, Item) and shelf.best.id == "3"
+    assert Shelf(best=None).best is None
+
+
+def test_default_factory_builds_a_fresh_value_per_instance():
+    first, second = Item(id="1"), Item(id="2")
+    first.tags.append("x")
+    assert second.tags == []
+
+
+def test_extra_keys_are_kept_as_attributes():
+    item = Item(id="1", unknown=5)
+    assert item.unknown == 5
+    assert "unknown" not in item.dict()
+
+
+def test_model_dump_json_is_identical_with_and_without_orjson(monkeypatch):
+    shelf = Shelf(items=[{"id": "1", "tags": ["日本語", "b"]}, {"id": "2"}], best={"id": "3", "cover": "c.png"})
+    with_orjson = shelf.model_dump_json()
+    monkeypatch.setattr(pydantic, "orjson", None)
+    without = shelf.model_dump_json()
+    assert with_orjson == without
+    assert json.loads(without) == shelf.dict()
+    assert Shelf.model_validate_json(without).dict() == shelf.dict()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from launcher.models import Game, SettingsStore, detect_kind
+
+
+def _game(idx: int, **extra) -> Game:
+    data = {"id": f"id-{idx}", "name": f"Game {idx}", "exec_path": f"C:/Games/Game{idx}.exe"}
+    data.update(extra)
+    return Game(**data)
+
+
+def test_store_indexes_follow_mutations(tmp_path):
+    store = SettingsStore(tmp_path)
+    assert store.add_many([_game(1), _game(2), _game(2)]) == 2
+    assert store.by_id("id-2").name == "Game 2"
+    assert store.contains(_game(1))
+
+    store.update(_game(1, exec_path="C:/Games/Renamed.exe"))
+    assert not store.contains(_game(1))
+    assert store.by_id("id-1").exec_path == "C:/Games/Renamed.exe"
+
+    store.delete(["id-1"])
+    assert store.by_id("id-1") is None
+    assert store.by_id("id-2").name == "Game 2"
+
+
+def test_store_round_trips_settings_file(tmp_path):
+    store = SettingsStore(tmp_path)
+    store.add(_game(1, tags=["RPG"], favorite=True))
+
+    reloaded = SettingsStore(tmp_path)
+    game = reloaded.by_id("id-1")
+    assert game is not None
+    assert game.tags == ["RPG"]
+    assert game.favorite is True
+    assert reloaded.contains(_game(1))
+
+
+def test_scheduled_store_coalesces_writes_until_flush(tmp_path):
+    scheduled = []
+    store = SettingsStore(tmp_path, schedule=scheduled.append)
+    store.add(_game(1))
+    store.add(_game(2))
+    store.delete(["id-1"])
+
+    assert len(scheduled) == 1
+    assert not store.settings_path.exists()
+
+    scheduled[0]()
+    assert [g.id for g in SettingsStore(tmp_path).games] == ["id-2"]
+
+    store.update(_game(2, name="Renamed"))
+    store.flush()
+    assert SettingsStore(tmp_path).by_id("id-2").name == "Renamed"
+
+
+def test_search_blob_is_rebuilt_after_store_update(tmp_path):
+    store = SettingsStore(tmp_path)
+    store.add(_game(1, tags=["RPG"]))
+    game = store.by_id("id-1")
+    assert "rpg" in game.search_blob
+
+    game.name = "Doom Eternal"
+    store.update(game)
+    assert "doom eternal" in store.by_id("id-1").search_blob
+    assert "_search_blob" not in game.to_dict()
+    assert game.clone(name="Other").search_blob.startswith("other")
+
+
+def test_detect_kind_dispatches_on_prefix_and_suffix():
+    assert detect_kind("steam://rungameid/10") == "steam"
+    assert detect_kind("com.epicgames.launcher://apps/Fn?action=launch") == "epic"
+    assert detect_kind("C:/Games/Thing.LNK") == "lnk"
+    assert detect_kind("C:/Games/Thing.exe") == "exe"
+
+
+def test_search_blob_is_casefolded():
+    assert "strasse" in _game(1, name="Straße Ｒａｃｅｒ").search_blob
+    assert "ｒａｃｅｒ" in _game(1, name="Straße Ｒａｃｅｒ").search_blob
@@ -3,12 +3,84 @@
 # ui/card.py
 # ------------------------------
 from __future__ import annotations
+from functools import partial
 from pathlib import Path
+from typing import Optional
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from launcher.models import Game
+from utils.cover_loader import fit_image, request_smooth
 from utils.pixcache import PixCache
 
+SHADOW_MARGIN = 10
+_CARD_RADIUS = 12
+_SHADOW_OFFSET_Y = 3
+_CARD_BG = QtGui.QColor("#f2f2f2")
+_CARD_BG_HOVER = QtGui.QColor("#eaeaea")
+_IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".ico"})
+
+def _shadow_ninepatch() -> QtGui.QPixmap:
+    """Soft rounded shadow rendered once; cards stretch its edges as a 9-slice."""
+    key = "__shadow__"
+    cached = QtGui.QPixmapCache.find(key)
+    if cached is not None: return cached
+    m = SHADOW_MARGIN; side = 2*(m + _CARD_RADIUS) + 1
+    img = QtGui.QImage(side, side, QtGui.QImage.Format_ARGB32_Premultiplied); img.fill(QtCore.Qt.transparent)
+    p = QtGui.QPainter(img); p.setRenderHint(QtGui.QPainter.Antialiasing); p.setPen(QtCore.Qt.NoPen)
+    p.setBrush(QtGui.QColor(0, 0, 0, 7))
+    # Stacked translucent rings approximate the old 16px blur at alpha 80.
+    for i in range(m):
+        rect = QtCore.QRectF(i, i, side - 2*i, side - 2*i)
+        p.drawRoundedRect(rect, _CARD_RADIUS + m - i, _CARD_RADIUS + m - i)
+    p.end()
+    pix = QtGui.QPixmap.fromImage(img)
+    QtGui.QPixmapCache.insert(key, pix)
+    return pix
+
+def _draw_ninepatch(p: QtGui.QPainter, target: QtCore.QRect, pix: QtGui.QPixmap, corner: int):
+    sx = (0, corner, pix.width() - corner, pix.width())
+    sy = (0, corner, pix.height() - corner, pix.height())
+    tx = (target.left(), target.left() + corner, target.right() + 1 - corner, target.right() + 1)
+    ty = (target.top(), target.top() + corner, target.bottom() + 1 - corner, target.bottom() + 1)
+    for row in range(3):
+        for col in range(3):
+            p.drawPixmap(QtCore.QRect(tx[col], ty[row], tx[col+1] - tx[col], ty[row+1] - ty[row]),
+                         pix, QtCore.QRect(sx[col], sy[row], sx[col+1] - sx[col], sy[row+1] - sy[row]))
+
+class _CoverView(QtWidgets.QWidget):
+    """Cover pixmap with the title bar painted over its bottom edge."""
+    _BAR = QtGui.QColor(255, 255, 255, 180)
+    _TITLE = QtGui.QColor("#333")
+    _TITLE_FLAGS = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter | QtCore.Qt.TextWordWrap
+
+    def __init__(self, title: str):
+        super().__init__()
+        self._pix = QtGui.QPixmap(); self._title = title
+        font = self.font(); font.setWeight(QtGui.QFont.DemiBold); self.setFont(font)
+
+    def pixmap(self) -> QtGui.QPixmap:
+        return self._pix
+
+    def setPixmap(self, pix: QtGui.QPixmap):
+        self._pix = pix; self.update()
+
+    def setTitle(self, title: str):
+        if title != self._title: self._title = title; self.update()
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        p = QtGui.QPainter(self); r = self.rect()
+        if not self._pix.isNull():
+            # Covers are scaled to fill, so crop the overflow around the centre.
+            src = QtCore.QRect(QtCore.QPoint(0, 0), r.size())
+            src.moveCenter(self._pix.rect().center())
+            p.drawPixmap(r, self._pix, src)
+        text = r.adjusted(8, 6, -8, -6)
+        h = p.fontMetrics().boundingRect(text, self._TITLE_FLAGS, self._title).height() + 12
+        bar = QtCore.QRect(0, r.height() - h, r.width(), h)
+        p.fillRect(bar, self._BAR)
+        p.setPen(self._TITLE); p.drawText(bar.adjusted(8, 6, -8, -6), self._TITLE_FLAGS, self._title)
+        p.end()
+
 class CardWidget(QtWidgets.QFrame):
     clicked = QtCore.Signal(str)
     editRequested = QtCore.Signal(str)
@@ -21,90 +93,143 @@ class CardWidget(QtWidgets.QFrame):
         self.entry: Game = entry
         self.cardSize = size
         self.pix_cache = pix_cache
+        self._cover_loaded = False
+        self._loaded_cover: Optional[str] = None
+        self._fast_cover = False
+        self._draft: Optional[tuple[str, QtGui.QImage]] = None
         self.setObjectName("card")
         self.setCursor(QtCore.Qt.PointingHandCursor)
         self.setAcceptDrops(True)
-        self.setStyleSheet("""
-            QFrame#card { border-radius: 12px; background-color: #f2f2f2; }
-            QFrame#card:hover { background-color: #eaeaea; }
-        """)
-        self.shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        self.shadow.setOffset(0, 3)
-        self.shadow.setBlurRadius(16)
-        self.shadow.setColor(QtGui.QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(self.shadow)
+        # Shadow and rounded background are painted in paintEvent (no blur effect per paint).
+        self.setAttribute(QtCore.Qt.WA_Hover)
+        self.setContentsMargins(SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN, SHADOW_MARGIN)
         self.build_ui()
 
     def build_ui(self):
         lay = QtWidgets.QVBoxLayout(self); lay.setContentsMargins(6,6,6,6); lay.setSpacing(6)
-        favBtn = QtWidgets.QToolButton(); favBtn.setText("★" if self.entry.favorite else "☆")
-        favBtn.setCursor(QtCore.Qt.PointingHandCursor); favBtn.clicked.connect(lambda: self.favToggled.emit(self.entry.id))
-        favBtn.setStyleSheet("color:#d4a017;font-size:16px")
+        self.favBtn = favBtn = QtWidgets.QToolButton()
+        favBtn.setCursor(QtCore.Qt.PointingHandCursor); favBtn.clicked.connect(partial(self._emit_id, self.favToggled))
+        favBtn.setObjectName("cardFav")
         top = QtWidgets.QHBoxLayout(); top.addWidget(favBtn, 0, QtCore.Qt.AlignLeft); top.addStretch(1)
-        menuBtn = QtWidgets.QToolButton(); menuBtn.setText("⋯"); menuBtn.setPopupMode(QtWidgets.QToolButton.InstantPopup)
-        menu = QtWidgets.QMenu(menuBtn)
-        menu.addAction("起動", lambda: self.clicked.emit(self.entry.id))
-        menu.addAction("編集", lambda: self.editRequested.emit(self.entry.id))
-        menu.addAction("削除", lambda: self.deleteRequested.emit(self.entry.id))
-        menu.addAction("カバーを選択…", self.pick_cover)
-        menuBtn.setMenu(menu); top.addWidget(menuBtn, 0, QtCore.Qt.AlignRight)
+        # The menu is built on first press; most cards never open it.
+        self.menuBtn = menuBtn = QtWidgets.QToolButton(); menuBtn.setText("⋯"); menuBtn.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        menuBtn.pressed.connect(self._ensure_menu); top.addWidget(menuBtn, 0, QtCore.Qt.AlignRight)
         lay.addLayout(top)
 
-        self.container = QtWidgets.QFrame(); self.container.setObjectName("cardContainer")
-        self.container.setStyleSheet("QFrame#cardContainer{border-radius:10px;background:#fff}")
-        self.stacked = QtWidgets.QStackedLayout(self.container); self.stacked.setContentsMargins(0,0,0,0)
-        self.coverLbl = QtWidgets.QLabel(); self.coverLbl.setFixedWidth(self.cardSize.width()); self.coverLbl.setAlignment(QtCore.Qt.AlignCenter)
-        self.coverLbl.setScaledContents(False); self.stacked.addWidget(self.coverLbl)
-        self.overlay = QtWidgets.QWidget(); self.overlay.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
-        ov_l = QtWidgets.QVBoxLayout(self.overlay); ov_l.setContentsMargins(0,0,0,0); ov_l.addStretch(1)
-        self.bar = QtWidgets.QFrame(); self.bar.setStyleSheet("background-color: rgba(255,255,255,180); border-bottom-left-radius:10px; border-bottom-right-radius:10px;")
-        bar_l = QtWidgets.QHBoxLayout(self.bar); bar_l.setContentsMargins(8,6,8,6)
-        self.titleLbl = QtWidgets.QLabel(self.entry.name); self.titleLbl.setStyleSheet("color:#333; font-weight:600;"); self.titleLbl.setWordWrap(True)
-        bar_l.addWidget(self.titleLbl); ov_l.addWidget(self.bar); self.stacked.addWidget(self.overlay)
-        lay.addWidget(self.container, 0, QtCore.Qt.AlignHCenter)
+        self.coverView = _CoverView(self.entry.name); self.coverView.setFixedWidth(self.cardSize.width())
+        lay.addWidget(self.coverView, 0, QtCore.Qt.AlignHCenter)
+        self.refresh()
+
+    def _ensure_menu(self):
+        if self.menuBtn.menu() is not None: return
+        menu = QtWidgets.QMenu(self.menuBtn)
+        menu.addAction("起動", partial(self._emit_id, self.clicked))
+        menu.addAction("編集", partial(self._emit_id, self.editRequested))
+        menu.addAction("削除", partial(self._emit_id, self.deleteRequested))
+        menu.addAction("カバーを選択…", self.pick_cover)
+        self.menuBtn.setMenu(menu)
+        # InstantPopup only opens a menu that existed at press time, so open this one by hand.
+        self.menuBtn.setDown(False); self.menuBtn.showMenu()
+
+    def _emit_id(self, signal: QtCore.SignalInstance):
+        signal.emit(self.entry.id)
+
+    def update_game(self, entry: Game):
+        """Point the card at ``entry`` and refresh it in place.
+
+        The grid recycles cards, so ``entry`` may be a different game; a cover
+        that was already loaded is kept only if the cover path is unchanged.
+        """
+        self.entry = entry
         self.refresh()
 
     def refresh(self):
-        self.titleLbl.setText(self.entry.name)
+        self.favBtn.setText("★" if self.entry.favorite else "☆")
+        self.coverView.setTitle(self.entry.name)
+        if not self._cover_loaded or self._loaded_cover != self.entry.cover:
+            # Placeholder until the grid reports the card as visible.
+            self._cover_loaded = False; self._draft = None
+            self.set_cover(None)
+
+    @property
+    def cover_loaded(self) -> bool:
+        return self._cover_loaded
+
+    @property
+    def fast_cover(self) -> bool:
+        return self._fast_cover
+
+    def ensure_cover_loaded(self, fast: bool = False):
+        if self._cover_loaded: return
+        self._cover_loaded = True
+        self._loaded_cover = self.entry.cover
+        self._fast_cover = fast
         self.set_cover(self.entry.cover)
 
-    def _build_default_pixmap(self, w: int, h: int) -> QtGui.QPixmap:
-        key = ("__generated__", w, h)
-        cached = self.pix_cache.get(key)
-        if cached: return cached
-        pix = QtGui.QPixmap(w, h)
-        p = QtGui.QPainter(pix)
-        p.fillRect(pix.rect(), QtGui.QColor(230,232,237))
-        p.setPen(QtGui.QPen(QtGui.QColor(120,120,130)))
-        p.drawText(pix.rect(), QtCore.Qt.AlignCenter, "No Cover")
-        p.end()
-        self.pix_cache.put(key, pix)
-        return pix
+    def rescale_smooth(self):
+        if not self._fast_cover: return
+        self._fast_cover = False
+        draft, self._draft = self._draft, None
+        if draft is None: return
+        path, img = draft
+        # The smooth pass runs on the thread pool; the draft stays up until it lands.
+        request_smooth(path, img, self._cover_size(img), self._on_smooth_ready)
+
+    @QtCore.Slot(str, QtGui.QImage)
+    def _on_smooth_ready(self, path: str, img: QtGui.QImage):
+        pix = QtGui.QPixmap.fromImage(img)
+        self.pix_cache.put(self.pix_cache.cover_key(path, self.cardSize.width()), pix)
+        if self._cover_loaded and path == self.entry.cover and not self._fast_cover: self._show_cover(pix)
 
     def set_cover(self, path: str):
-        pix = QtGui.QPixmap()
-        if path and Path(path).exists():
-            orig_key = (Path(path).as_posix(), -1, -1)
-            cached = self.pix_cache.get(orig_key)
-            if cached: pix = cached
-            else:
-                pix.load(path)
-                if not pix.isNull(): self.pix_cache.put(orig_key, pix)
-        if pix.isNull():
-            w = self.cardSize.width(); h = int(w*1.5)
-            pix = self._build_default_pixmap(w, h)
-        ratio = max(0.1, pix.width()/max(1, pix.height()))
-        target_w = self.cardSize.width(); target_h = int(target_w/ratio)
-        target_h = max(int(target_w*0.9), min(int(target_w*1.8), target_h))
-        self.coverLbl.setFixedSize(target_w, target_h)
-        self.container.setFixedSize(target_w, target_h)
-        self.overlay.setFixedSize(target_w, target_h)
-        scale_key = ((Path(path).as_posix() if path else "__generated__"), target_w, target_h)
-        cached_scaled = self.pix_cache.get(scale_key)
-        if cached_scaled is None:
-            scaled = pix.scaled(self.coverLbl.size(), QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation)
-            self.pix_cache.put(scale_key, scaled); self.coverLbl.setPixmap(scaled)
-        else: self.coverLbl.setPixmap(cached_scaled)
+        # Only the fitted pixmap is cached; on a miss the file is decoded again off-thread.
+        target_w = self.cardSize.width(); pix = None
+        if path:
+            # On a miss the cover decodes at card width in the background; the placeholder shows meanwhile.
+            pix = self.pix_cache.request(path, target_w, self._on_cover_loaded)
+        if pix is None or pix.isNull():
+            pix = self.pix_cache.placeholder(target_w, int(target_w*1.5))
+        self._show_cover(pix)
+
+    def _show_cover(self, pix: QtGui.QPixmap):
+        self.coverView.setFixedSize(pix.size()); self.coverView.setPixmap(pix)
+
+    def _cover_size(self, img: QtGui.QImage) -> QtCore.QSize:
+        target_w = self.cardSize.width()
+        ratio = max(0.1, img.width()/max(1, img.height())); target_h = int(target_w/ratio)
+        return QtCore.QSize(target_w, max(int(target_w*0.9), min(int(target_w*1.8), target_h)))
+
+    def _fit_cover(self, img: QtGui.QImage, fast: bool) -> QtGui.QPixmap:
+        mode = QtCore.Qt.FastTransformation if fast else QtCore.Qt.SmoothTransformation
+        return QtGui.QPixmap.fromImage(fit_image(img, self._cover_size(img), mode))
+
+    @QtCore.Slot(str, QtGui.QImage)
+    def _on_cover_loaded(self, path: str, img: QtGui.QImage):
+        key = self.pix_cache.cover_key(path, self.cardSize.width())
+        current = self._cover_loaded and path == self.entry.cover
+        if img.isNull():
+            # Failed decodes are cached as null pixmaps so they are not retried.
+            self.pix_cache.put(key, QtGui.QPixmap()); return
+        cached = self.pix_cache.get(key)
+        if cached is not None:
+            pix = cached  # another card sharing this cover already fitted it
+        elif current and self._fast_cover:
+            # The draft is not cached; rescale_smooth redoes it from the kept image.
+            pix = self._fit_cover(img, True); self._draft = (path, img)
+        else:
+            pix = self._fit_cover(img, False); self.pix_cache.put(key, pix)
+        if current: self._show_cover(pix)
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        p = QtGui.QPainter(self); p.setRenderHint(QtGui.QPainter.Antialiasing)
+        body = QtCore.QRectF(self.contentsRect())
+        path = QtGui.QPainterPath(); path.addRoundedRect(body, _CARD_RADIUS, _CARD_RADIUS)
+        outside = QtGui.QPainterPath(); outside.addRect(QtCore.QRectF(self.rect()))
+        p.save(); p.setClipPath(outside.subtracted(path))
+        _draw_ninepatch(p, self.rect().translated(0, _SHADOW_OFFSET_Y), _shadow_ninepatch(), SHADOW_MARGIN + _CARD_RADIUS)
+        p.restore()
+        p.fillPath(path, _CARD_BG_HOVER if self.underMouse() else _CARD_BG)
+        p.end()
 
     def mousePressEvent(self, e: QtGui.QMouseEvent):
         if e.button() == QtCore.Qt.LeftButton:
@@ -120,7 +245,7 @@ class CardWidget(QtWidgets.QFrame):
         for u in urls:
             p = u.toLocalFile()
             if not p: continue
-            if Path(p).suffix.lower() in {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".ico"}:
+            if Path(p).suffix.lower() in _IMG_EXTS:
                 self.coverDropped.emit(self.entry.id, p); break
         ev.acceptProposedAction()
 
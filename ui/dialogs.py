@@ -1,12 +1,13 @@
 """Dialog windows used in the launcher."""
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 from PySide6 import QtCore, QtWidgets
 
-from launcher.models import APP_TITLE, Game
+from launcher.models import APP_TITLE, Game, detect_kind
 
 
 class EntryDialog(QtWidgets.QDialog):
@@ -27,27 +28,13 @@ class EntryDialog(QtWidgets.QDialog):
         self.fallback_edit = QtWidgets.QLineEdit()
         self.run_as_admin_chk = QtWidgets.QCheckBox("管理者として実行")
 
-        def row_with_browse(line_edit: QtWidgets.QLineEdit, caption: str, filt: str = "") -> QtWidgets.QWidget:
-            btn = QtWidgets.QPushButton("参照…")
-            layout = QtWidgets.QHBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.addWidget(line_edit)
-            layout.addWidget(btn)
-            container = QtWidgets.QWidget()
-            container.setLayout(layout)
-            if caption == "作業ディレクトリ":
-                btn.clicked.connect(lambda: self._browse_dir(line_edit, caption))
-            else:
-                btn.clicked.connect(lambda: self._browse_file(line_edit, caption, filt))
-            return container
-
         form.addRow("名前", self.name_edit)
-        form.addRow("パス", row_with_browse(self.path_edit, "実行ファイル/ショートカット/フォルダ", "Executables/Shortcuts (*.*)"))
+        form.addRow("パス", self._make_browse_row(self.path_edit, "実行ファイル/ショートカット/フォルダ", "Executables/Shortcuts (*.*)"))
         form.addRow("引数", self.args_edit)
-        form.addRow("作業ディレクトリ", row_with_browse(self.workdir_edit, "作業ディレクトリ"))
+        form.addRow("作業ディレクトリ", self._make_browse_row(self.workdir_edit, "作業ディレクトリ"))
         form.addRow("タグ(カンマ)", self.tags_edit)
-        form.addRow("カバー画像", row_with_browse(self.cover_edit, "カバー画像", "Images (*.png *.jpg *.jpeg *.webp *.bmp *.ico)"))
-        form.addRow("フォールバックexe", row_with_browse(self.fallback_edit, "フォールバックexe", "Executables (*.exe)"))
+        form.addRow("カバー画像", self._make_browse_row(self.cover_edit, "カバー画像", "Images (*.png *.jpg *.jpeg *.webp *.bmp *.ico)"))
+        form.addRow("フォールバックexe", self._make_browse_row(self.fallback_edit, "フォールバックexe", "Executables (*.exe)"))
         form.addRow("", self.run_as_admin_chk)
 
         btn_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
@@ -68,6 +55,20 @@ class EntryDialog(QtWidgets.QDialog):
             self.fallback_edit.setText(entry.fallback_exe or "")
             self.run_as_admin_chk.setChecked(entry.run_as_admin)
 
+    def _make_browse_row(self, line_edit: QtWidgets.QLineEdit, caption: str, filt: str = "") -> QtWidgets.QWidget:
+        btn = QtWidgets.QPushButton("参照…")
+        layout = QtWidgets.QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(line_edit)
+        layout.addWidget(btn)
+        container = QtWidgets.QWidget()
+        container.setLayout(layout)
+        if caption == "作業ディレクトリ":
+            btn.clicked.connect(partial(self._browse_dir, line_edit, caption))
+        else:
+            btn.clicked.connect(partial(self._browse_file, line_edit, caption, filt))
+        return container
+
     def _browse_dir(self, target: QtWidgets.QLineEdit, caption: str) -> None:
         directory = QtWidgets.QFileDialog.getExistingDirectory(self, caption)
         if directory:
@@ -80,15 +81,6 @@ class EntryDialog(QtWidgets.QDialog):
             if target is self.path_edit and not self.name_edit.text().strip():
                 self.name_edit.setText(Path(file_path).stem)
 
-    def _detect_kind(self, exec_path: str) -> str:
-        if exec_path.startswith("steam://"):
-            return "steam"
-        if exec_path.startswith("com.epicgames.launcher://"):
-            return "epic"
-        if exec_path.lower().endswith(".lnk"):
-            return "lnk"
-        return "exe"
-
     def get_value(self) -> Optional[Game]:
         name = self.name_edit.text().strip()
         exec_path = self.path_edit.text().strip()
@@ -103,7 +95,7 @@ class EntryDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, APP_TITLE, "名前とパスは必須だよ")
             return None
 
-        kind = self._detect_kind(exec_path)
+        kind = detect_kind(exec_path)
         if self.entry:
             game = Game(
                 id=self.entry.id,
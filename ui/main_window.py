@@ -4,13 +4,13 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from launcher import discovery, launch_win
-from launcher.models import APP_TITLE, Game, SettingsStore
-from ui.card import CardWidget
+from launcher.models import APP_TITLE, Game, SettingsStore, detect_kind
+from ui.card import SHADOW_MARGIN, CardWidget
 from ui.dialogs import EntryDialog
 from utils.launcher import launch_path
 from utils.pixcache import PixCache
@@ -18,7 +18,17 @@ from utils.pixcache import PixCache
 LOGGER = logging.getLogger(__name__)
 
 CARD_WIDTH = 240
+MIN_COLUMNS = 3
 MAX_COLUMNS = 6
+SAVE_DELAY_MS = 500
+REFRESH_DEBOUNCE_MS = 120
+COVER_LOAD_DELAY_MS = 50
+SMOOTH_RESCALE_DELAY_MS = 250
+# Rows of cards kept placed above and below the viewport.
+OVERSCAN_ROWS = 2
+# Released cards kept for reuse; the rest are deleted.
+SPARE_CARDS = 3 * MAX_COLUMNS
+_EXE_EXTS = frozenset({".exe", ".bat", ".lnk"})
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -28,7 +38,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1200, 800)
 
         self.base_dir = Path(sys.argv[0]).resolve().parent
-        self.store = SettingsStore(self.base_dir)
+        self.store = SettingsStore(
+            self.base_dir, schedule=lambda flush: QtCore.QTimer.singleShot(SAVE_DELAY_MS, flush)
+        )
 
         self.pix_cache = PixCache()
 
@@ -37,6 +49,12 @@ class MainWindow(QtWidgets.QMainWindow):
         # ----- Header -----
         self.search_edit = QtWidgets.QLineEdit()
         self.search_edit.setPlaceholderText("検索（名前/パス/タグを含む文字列検索）")
+        # Every grid refresh request goes through this timer so bursts of
+        # keystrokes, resizes and edits coalesce into one rebuild.
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh_grid)
         self.search_edit.textChanged.connect(self.refresh_grid)
 
         self.only_fav_chk = QtWidgets.QCheckBox("★のみ")
@@ -72,15 +90,44 @@ class MainWindow(QtWidgets.QMainWindow):
         self.center_w = QtWidgets.QWidget()
         self.grid = QtWidgets.QGridLayout(self.center_w)
         self.grid.setContentsMargins(24, 24, 24, 40)
-        self.grid.setHorizontalSpacing(18)
-        self.grid.setVerticalSpacing(22)
+        # Cards reserve SHADOW_MARGIN on each side for their painted shadow.
+        self.grid.setHorizontalSpacing(max(0, 18 - 2 * SHADOW_MARGIN))
+        self.grid.setVerticalSpacing(max(0, 22 - 2 * SHADOW_MARGIN))
         self.grid.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop)
 
         self.scroll.setWidget(self.center_w)
         self.setCentralWidget(self.scroll)
 
+        self._card_size = QtCore.QSize(CARD_WIDTH, CARD_WIDTH * 3 // 2)
+        self._cards: Dict[str, CardWidget] = {}
+        # Minimum available width for each column count, widest last.
+        self._col_breakpoints = [(k * (CARD_WIDTH + 24), k) for k in range(MIN_COLUMNS, MAX_COLUMNS + 1)]
+        # (columns, game ids, first row, end row) of the placed window of rows.
+        self._last_layout: Optional[Tuple[int, Tuple[str, ...], int, int]] = None
+        self._row_height = int(CARD_WIDTH * 1.5)
+        # Spacers stand in for the rows above and below the placed window.
+        self._head = QtWidgets.QWidget(self.center_w)
+        self._head.hide()
+        self._tail = QtWidgets.QWidget(self.center_w)
+        self._tail.hide()
+        self._spare: List[CardWidget] = []
+        self._anchor: Optional[Tuple[CardWidget, int]] = None
+        self._positions: Dict[str, Tuple[int, int]] = {}
+        self._last_filter: Tuple[str, Tuple[int, bool], List[Game]] = ("", (-1, False), [])
+        self._cover_timer = QtCore.QTimer(self)
+        self._cover_timer.setSingleShot(True)
+        self._cover_timer.setInterval(COVER_LOAD_DELAY_MS)
+        self._cover_timer.timeout.connect(self._load_visible_covers)
+        # _on_scrolled restarts the timers itself: connecting valueChanged(int)
+        # straight to QTimer.start would pick start(msec) and clobber the interval.
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self._smooth_timer = QtCore.QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._rescale_smooth)
+
         self.setAcceptDrops(True)
-        self.refresh_grid()
+        self._do_refresh_grid()
 
     def apply_light_style(self) -> None:
         QtWidgets.QApplication.setStyle("Fusion")
@@ -91,6 +138,7 @@ class MainWindow(QtWidgets.QMainWindow):
             QLineEdit { padding: 8px; border-radius: 10px; }
             QCheckBox { padding: 4px; }
             QPushButton, QToolButton { padding: 6px 12px; border-radius: 8px; }
+            QToolButton#cardFav { color: #d4a017; font-size: 16px; }
             """
         )
 
@@ -135,104 +183,241 @@ class MainWindow(QtWidgets.QMainWindow):
             super().dragEnterEvent(ev)
 
     def dropEvent(self, ev: QtGui.QDropEvent) -> None:
-        urls = ev.mimeData().urls()
-        added = 0
-        for u in urls:
-            p = u.toLocalFile()
-            if not p:
-                continue
-            if "://" in p:
-                exec_path = p
-                name = p
-                working_dir = None
-                kind = self._detect_kind(exec_path)
-            else:
-                path = Path(p)
-                if not (
-                    path.is_dir() or path.suffix.lower() in {".exe", ".bat", ".lnk"}
-                ):
-                    continue
-                exec_path = str(path)
-                name = path.stem
-                working_dir = str(path.parent)
-                kind = self._detect_kind(exec_path)
-            game = Game(
-                id=str(QtCore.QUuid.createUuid()),
-                name=name,
-                exec_path=exec_path,
-                working_dir=working_dir,
-                tags=[],
-                cover=None,
-                kind=kind,
-            )
-            self.store.add(game)
-            added += 1
-        if added:
+        games = [game for game in map(self._game_from_drop, ev.mimeData().urls()) if game]
+        # One batched mutation; drops of games already in the library are skipped.
+        if games and self.store.add_many(games):
             self.refresh_grid()
         ev.acceptProposedAction()
 
-    def _detect_kind(self, exec_path: str) -> str:
-        if exec_path.startswith("steam://"):
-            return "steam"
-        if exec_path.startswith("com.epicgames.launcher://"):
-            return "epic"
-        if exec_path.lower().endswith(".lnk"):
-            return "lnk"
-        return "exe"
+    @staticmethod
+    def _game_from_drop(url: QtCore.QUrl) -> Optional[Game]:
+        p = url.toLocalFile()
+        if not p:
+            return None
+        if "://" in p:
+            exec_path = name = p
+            working_dir = None
+        else:
+            path = Path(p)
+            # Check the suffix first so only extensionless drops pay for a stat.
+            if not (path.suffix.lower() in _EXE_EXTS or path.is_dir()):
+                return None
+            exec_path = str(path)
+            name = path.stem
+            working_dir = str(path.parent)
+        return Game(
+            id=str(QtCore.QUuid.createUuid()),
+            name=name,
+            exec_path=exec_path,
+            working_dir=working_dir,
+            tags=[],
+            cover=None,
+            kind=detect_kind(exec_path),
+        )
 
     def filtered_games(self) -> List[Game]:
-        query = self.search_edit.text().strip().lower()
+        query = self.search_edit.text().strip().casefold()
         only_fav = self.only_fav_chk.isChecked()
+        if not query and not only_fav:
+            return list(self.store.games)
+        state = (self.store.version, only_fav)
+        last_query, last_state, last_matches = self._last_filter
+        if query == last_query and state == last_state:
+            return last_matches
+        if last_query and query.startswith(last_query) and state == last_state:
+            # A longer query can only narrow the previous matches.
+            candidates = last_matches
+        else:
+            candidates = self.store.games
         filtered: List[Game] = []
-        for game in self.store.games:
+        for game in candidates:
             if only_fav and not game.favorite:
                 continue
-            if query:
-                haystack = " ".join(
-                    [
-                        game.name.lower(),
-                        game.exec_path.lower(),
-                        (game.args or "").lower(),
-                        ",".join(game.tags).lower(),
-                    ]
-                )
-                if query not in haystack:
-                    continue
+            if query and query not in game.search_blob:
+                continue
             filtered.append(game)
+        self._last_filter = (query, state, filtered)
         return filtered
 
     def refresh_grid(self) -> None:
-        while self.grid.count():
-            item = self.grid.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        card_size = QtCore.QSize(CARD_WIDTH, int(CARD_WIDTH * 1.5))
+        self._refresh_timer.start()
+
+    def _do_refresh_grid(self) -> None:
+        # Suspend painting and layout so the bulk edit costs one relayout.
+        self.scroll.setUpdatesEnabled(False)
+        self.center_w.setUpdatesEnabled(False)
+        self.grid.setEnabled(False)
+        relayout = True
+        try:
+            relayout = self._populate_grid()
+        finally:
+            self.grid.setEnabled(True)
+            if relayout:
+                self.grid.invalidate()
+            self.center_w.setUpdatesEnabled(True)
+            self.scroll.setUpdatesEnabled(True)
+            if relayout:
+                self.center_w.adjustSize()
+        anchor, self._anchor = self._anchor, None
+        if anchor is not None:
+            # Spacer heights are estimates; keep the cards in view where they were.
+            self.grid.activate()
+            card, y = anchor
+            if card.y() != y:
+                bar = self.scroll.verticalScrollBar()
+                bar.setValue(bar.value() + card.y() - y)
+        self._cover_timer.start()
+
+    def _populate_grid(self) -> bool:
+        """Place cards for the window of rows around the viewport; return False if no card moved."""
         games = self.filtered_games()
 
-        avail = max(600, self.scroll.viewport().width() - 32)
-        cols = max(3, min(MAX_COLUMNS, int(avail / (card_size.width() + 24))))
-
-        r = c = 0
-        for game in games:
-            card = CardWidget(game, card_size, self.pix_cache)
-            card.clicked.connect(self.on_card_clicked)
-            card.editRequested.connect(self.on_edit)
-            card.deleteRequested.connect(self.on_delete)
-            card.favToggled.connect(self.on_fav)
-            card.coverDropped.connect(self.on_cover_dropped)
-            self.grid.addWidget(card, r, c)
-            c += 1
-            if c >= cols:
-                c = 0
-                r += 1
-
-        self.center_w.adjustSize()
+        avail = self.scroll.viewport().width() - 32
+        cols = next((k for w, k in reversed(self._col_breakpoints) if avail >= w), MIN_COLUMNS)
+
+        # Only rows near the viewport hold cards; spacers stand in for the rest.
+        ids = tuple(game.id for game in games)
+        total_rows = -(-len(games) // cols)
+        first, last = self._row_window(total_rows, OVERSCAN_ROWS)
+        shown = games[first * cols : last * cols]
+
+        layout_sig = (cols, ids, first, last)
+        if layout_sig == self._last_layout:
+            # Same cards in the same places; only their contents may have changed.
+            for game in shown:
+                self._cards[game.id].update_game(game)
+            return False
+        scrolling = self._last_layout is not None and self._last_layout[:2] == (cols, ids)
+        self._last_layout = layout_sig
+
+        wanted = {game.id for game in shown}
+        if scrolling:
+            # Any card placed before and after the change will do as an anchor.
+            self._anchor = next(((card, card.y()) for gid, card in self._cards.items() if gid in wanted), None)
+        # Cards leaving the window are recycled, so at most a window's worth exist.
+        for game_id in [gid for gid in self._cards if gid not in wanted]:
+            card = self._cards.pop(game_id)
+            del self._positions[game_id]
+            self.grid.removeWidget(card)
+            card.hide()
+            if len(self._spare) < SPARE_CARDS:
+                self._spare.append(card)
+            else:
+                card.deleteLater()
+
+        cards, positions, spare = self._cards, self._positions, self._spare
+        add_widget, remove_widget = self.grid.addWidget, self.grid.removeWidget
+        for index, game in enumerate(shown, first * cols):
+            cell = divmod(index, cols)
+            card = cards.get(game.id)
+            if card is None:
+                card = spare.pop() if spare else self._create_card(game)
+                cards[game.id] = card
+            card.update_game(game)
+            old = positions.get(game.id)
+            if old == cell:
+                continue
+            if old is not None:
+                remove_widget(card)
+            add_widget(card, *cell)
+            positions[game.id] = cell
+            card.show()
+            if index == 0:
+                self._row_height = card.sizeHint().height() + self.grid.verticalSpacing()
+
+        # Empty grid rows take no space, so cards keep their true row indices.
+        self._place_spacer(self._head, first - 1, first, cols)
+        self._place_spacer(self._tail, last, total_rows - last, cols)
+        return True
+
+    def _place_spacer(self, spacer: QtWidgets.QWidget, row: int, rows: int, cols: int) -> None:
+        self.grid.removeWidget(spacer)
+        if rows > 0:
+            spacer.setFixedHeight(rows * self._row_height - self.grid.verticalSpacing())
+            self.grid.addWidget(spacer, row, 0, 1, cols)
+            spacer.show()
+        else:
+            spacer.hide()
+
+    def _create_card(self, game: Game) -> CardWidget:
+        # Connected once for the card's lifetime; handlers look games up by id.
+        card = CardWidget(game, self._card_size, self.pix_cache)
+        card.clicked.connect(self.on_card_clicked)
+        card.editRequested.connect(self.on_edit)
+        card.deleteRequested.connect(self.on_delete)
+        card.favToggled.connect(self.on_fav)
+        card.coverDropped.connect(self.on_cover_dropped)
+        return card
+
+    def _row_window(self, total_rows: int, margin: int) -> Tuple[int, int]:
+        """Rows ``[first, end)`` overlapping the viewport, widened by ``margin`` rows."""
+        bar = self.scroll.verticalScrollBar()
+        top = bar.value()
+        last = min(total_rows, self._row_at(top + self.scroll.viewport().height()) + 1 + margin)
+        # Past the end (e.g. after the filter shrank) keep the last rows placed.
+        first = max(0, min(self._row_at(top) - margin, last - 2 * margin - 1))
+        return first, last
+
+    def _row_at(self, y: int) -> int:
+        """Grid row at content ``y``: measured inside the placed window, estimated outside."""
+        row_height = max(1, self._row_height)
+        spacing = self.grid.verticalSpacing()
+        estimate = max(0, y - self.grid.contentsMargins().top()) // row_height
+        layout = self._last_layout
+        if layout is None or layout[2] >= layout[3]:
+            return estimate
+        first, last = layout[2], layout[3]
+        if y < self.grid.cellRect(first, 0).top():
+            return min(first - 1, estimate)
+        for row in range(first, last):
+            bottom = self.grid.cellRect(row, 0).bottom() + spacing
+            if y <= bottom:
+                return row
+        return last + (y - bottom) // row_height
+
+    def _on_scrolled(self) -> None:
+        layout = self._last_layout
+        if layout is not None:
+            # Re-window once the viewport gets within a row of either edge.
+            first, last = self._row_window(-(-len(layout[1]) // layout[0]), 1)
+            if first < layout[2] or last > layout[3]:
+                self._do_refresh_grid()
+        self._cover_timer.start()
+        self._smooth_timer.start()
+
+    def _card_in_view(self, card: CardWidget, visible: QtCore.QRect) -> bool:
+        if card.isHidden():
+            return False
+        viewport = self.scroll.viewport()
+        return QtCore.QRect(card.mapTo(viewport, QtCore.QPoint(0, 0)), card.size()).intersects(visible)
+
+    def _load_visible_covers(self) -> None:
+        # Prefetch roughly one row above and below the visible area.
+        margin = CARD_WIDTH
+        visible = self.scroll.viewport().rect().adjusted(0, -margin, 0, margin)
+        loaded = False
+        for card in self._cards.values():
+            if not card.cover_loaded and self._card_in_view(card, visible):
+                # Scale fast while the view is moving; _rescale_smooth follows once idle.
+                card.ensure_cover_loaded(fast=True)
+                loaded = True
+        if loaded:
+            # Real covers can change card heights and pull more cards into view.
+            self._cover_timer.start()
+            self._smooth_timer.start()
+
+    def _rescale_smooth(self) -> None:
+        if self._cover_timer.isActive() or self._refresh_timer.isActive():
+            self._smooth_timer.start()
+            return
+        visible = self.scroll.viewport().rect()
+        for card in self._cards.values():
+            if card.fast_cover and self._card_in_view(card, visible):
+                card.rescale_smooth()
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
-        QtCore.QTimer.singleShot(0, self.refresh_grid)
+        self.refresh_grid()
 
     def entry_by_id(self, game_id: str) -> Optional[Game]:
         return self.store.by_id(game_id)
@@ -0,0 +1,95 @@
+# ------------------------------
+# utils/cover_loader.py
+# ------------------------------
+from __future__ import annotations
+from functools import partial
+from typing import Callable, Dict, List, Tuple
+import shiboken6
+from PySide6 import QtCore, QtGui
+
+class _CoverSignals(QtCore.QObject):
+    loaded = QtCore.Signal(str, QtGui.QImage)
+
+class CoverLoader(QtCore.QRunnable):
+    """Decode a cover into a QImage on the thread pool.
+
+    QImage is reentrant (QPixmap is not), so the worker only produces the image;
+    receivers convert it with QPixmap.fromImage on the GUI thread. The signals
+    object lives in the GUI thread, so emits are queued back to it.
+
+    Images wider than ``width`` are decoded straight at that width through
+    QImageReader.setScaledSize, so JPEGs never materialise at full resolution.
+    """
+    def __init__(self, path: str, width: int):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.signals = _CoverSignals()
+    def run(self):
+        reader = QtGui.QImageReader(self.path)
+        reader.setAutoTransform(True)
+        src = reader.size()
+        if src.isValid() and src.width() > self.width > 0:
+            h = max(1, round(src.height() * self.width / src.width()))
+            reader.setScaledSize(QtCore.QSize(self.width, h))
+        self.signals.loaded.emit(self.path, reader.read())
+
+def fit_image(img: QtGui.QImage, size: QtCore.QSize, mode: QtCore.Qt.TransformationMode) -> QtGui.QImage:
+    """Scale ``img`` to cover ``size`` and crop the overflow around the centre."""
+    if img.size() == size: return img
+    img = img.scaled(size, QtCore.Qt.KeepAspectRatioByExpanding, mode)
+    crop = QtCore.QRect(QtCore.QPoint(0, 0), size); crop.moveCenter(img.rect().center())
+    return img.copy(crop)
+
+class SmoothRescale(QtCore.QRunnable):
+    """Redo a fast draft with SmoothTransformation on the thread pool."""
+    def __init__(self, path: str, img: QtGui.QImage, size: QtCore.QSize):
+        super().__init__()
+        self.path = path
+        self.img = img
+        self.size = size
+        self.signals = _CoverSignals()
+    def run(self):
+        self.signals.loaded.emit(self.path, fit_image(self.img, self.size, QtCore.Qt.SmoothTransformation))
+
+# In-flight decodes and their subscribers. The entry also keeps the loader (and
+# so its signals object) alive until _finished has run on the GUI thread.
+_pending: Dict[Tuple[str, int], Tuple[CoverLoader, List[Callable[[str, QtGui.QImage], None]]]] = {}
+_rescaling: set[SmoothRescale] = set()
+
+def request_cover(path: str, width: int, slot: Callable[[str, QtGui.QImage], None]):
+    """Queue a decode of ``path`` at ``width``; concurrent requests share a loader.
+
+    ``slot`` is called on the GUI thread, even when it subscribes after the
+    worker has emitted but before the queued result has been delivered.
+    """
+    key = (path, width)
+    pending = _pending.get(key)
+    if pending is None:
+        loader = CoverLoader(path, width)
+        loader.signals.loaded.connect(partial(_finished, width))
+        _pending[key] = (loader, [slot])
+        QtCore.QThreadPool.globalInstance().start(loader)
+    else:
+        pending[1].append(slot)
+
+def request_smooth(path: str, img: QtGui.QImage, size: QtCore.QSize, slot: Callable[[str, QtGui.QImage], None]):
+    """Queue a smooth fit of ``img`` to ``size``; ``slot`` receives the result."""
+    job = SmoothRescale(path, img, size)
+    _rescaling.add(job)  # keep the signals object alive until it has emitted
+    job.signals.loaded.connect(slot)
+    job.signals.loaded.connect(partial(_rescaled, job))
+    QtCore.QThreadPool.globalInstance().start(job)
+
+def _rescaled(job: SmoothRescale, _path: str, _img: QtGui.QImage):
+    _rescaling.discard(job)
+
+def _finished(width: int, path: str, img: QtGui.QImage):
+    pending = _pending.pop((path, width), None)
+    if pending is None:
+        return
+    for slot in pending[1]:
+        owner = getattr(slot, "__self__", None)
+        if isinstance(owner, QtCore.QObject) and not shiboken6.isValid(owner):
+            continue  # the card was destroyed while its cover was decoding
+        slot(path, img)
@@ -6,6 +6,8 @@ from __future__ import annotations
 import os, sys, subprocess
 from pathlib import Path
 
+_WIN_EXEC_EXTS = frozenset({".exe", ".bat", ".cmd", ".com"})
+
 def launch_path(path: str, args: str = "", workdir: str = "") -> bool:
     path = path.strip(); args = args.strip(); cwd = workdir.strip() or None
     if "://" in path:
@@ -18,8 +20,13 @@ def launch_path(path: str, args: str = "", workdir: str = "") -> bool:
             return False
     try:
         if sys.platform.startswith("win"):
-            cmd = f'"{path}"' + (f" {args}" if args else "")
-            subprocess.Popen(cmd, cwd=cwd, shell=True)
+            if Path(path).suffix.lower() in _WIN_EXEC_EXTS:
+                # Pass args through verbatim, exactly as the old shell command line did.
+                cmd = subprocess.list2cmdline([path]) + (f" {args}" if args else "")
+                subprocess.Popen(cmd, cwd=cwd)
+            else:
+                # Shortcuts, folders and documents go through their shell association.
+                os.startfile(path, arguments=args, cwd=cwd)  # type: ignore
             return True
         elif sys.platform == "darwin":
             subprocess.Popen(["open", path], cwd=cwd)
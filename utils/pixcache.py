@@ -3,13 +3,56 @@
 # utils/pixcache.py
 # ------------------------------
 from __future__ import annotations
-from typing import Tuple, Optional
-from PySide6 import QtGui
+from pathlib import Path
+from typing import Callable, Tuple, Optional
+from PySide6 import QtCore, QtGui
+
+from utils.cover_loader import request_cover
+
+DEFAULT_LIMIT_KB = 64 * 1024
 
 class PixCache:
-    def __init__(self):
-        self._cache: dict[Tuple[str, int, int], QtGui.QPixmap] = {}
+    """Covers fitted to a card, keyed by (path, width, height).
+
+    Backed by the application-wide QPixmapCache, so Qt bounds memory with LRU
+    eviction and an evicted cover is simply decoded again. Only the displayed
+    pixmap is kept; originals are decoded as QImages on worker threads.
+    """
+    def __init__(self, limit_kb: int = DEFAULT_LIMIT_KB):
+        QtGui.QPixmapCache.setCacheLimit(limit_kb)
+        # Kept outside QPixmapCache so eviction never forces a repaint of these.
+        self._placeholders: dict[Tuple[int, int], QtGui.QPixmap] = {}
+    @staticmethod
+    def cover_key(path: str, width: int) -> Tuple[str, int, int]:
+        return (Path(path).as_posix(), width, -1)
+    @staticmethod
+    def _key(key: Tuple[str, int, int]) -> str:
+        path, w, h = key
+        return f"{path}|{w}x{h}"
     def get(self, key: Tuple[str, int, int]) -> Optional[QtGui.QPixmap]:
-        return self._cache.get(key)
+        return QtGui.QPixmapCache.find(self._key(key))
     def put(self, key: Tuple[str, int, int], pix: QtGui.QPixmap):
-        self._cache[key] = pix
+        QtGui.QPixmapCache.insert(self._key(key), pix)
+    def placeholder(self, w: int, h: int) -> QtGui.QPixmap:
+        """Shared "No Cover" pixmap for cards without a usable cover."""
+        pix = self._placeholders.get((w, h))
+        if pix is None:
+            pix = QtGui.QPixmap(w, h)
+            p = QtGui.QPainter(pix)
+            p.fillRect(pix.rect(), QtGui.QColor(230,232,237))
+            p.setPen(QtGui.QPen(QtGui.QColor(120,120,130)))
+            p.drawText(pix.rect(), QtCore.Qt.AlignCenter, "No Cover")
+            p.end()
+            self._placeholders[(w, h)] = pix
+        return pix
+    def request(self, path: str, width: int, callback: Callable[[str, QtGui.QImage], None]) -> Optional[QtGui.QPixmap]:
+        """Return the cached cover for ``path`` or queue a decode on the thread pool.
+
+        ``callback(path, image)`` runs on the GUI thread once the decode
+        finishes, whether it is a slot or a plain callable; requests for the
+        same path and width share one decode.
+        """
+        pix = self.get(self.cover_key(path, width))
+        if pix is None:
+            request_cover(path, width, callback)
+        return pix